@@ -0,0 +1,75 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Callable, TypeVar
+
+from internal import __version__
+
+T = TypeVar("T")
+
+
+def _stamp(path: str) -> tuple[int, int]:
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def load_or_compute(
+    path: str,
+    loader: Callable[[str], T],
+    *,
+    cache_directory: str,
+    variant: tuple = (),
+    code_files: tuple[str, ...] = (),
+) -> T:
+    """
+    Returns loader(path), memoized on disk in cache_directory by the size and modification time of the file.
+
+    Only picklable results can be memoized. Exceptions raised by loader are never memoized.
+
+    Args:
+        path: The file to be loaded.
+        loader: Loads the file.
+        cache_directory: The directory keeping the memoized results; it is created if needed.
+        variant: Other arguments that affect the result of loader.
+        code_files: The source files of the code producing the result;
+            the memoized result is dropped when they change, since the classes of the pickled objects may have changed.
+    """
+    try:
+        stamp = (_stamp(path), [_stamp(file) for file in code_files], __version__)
+    except OSError:
+        # Let the loader report the missing file
+        return loader(path)
+
+    # Only one result is kept for each file, so the cache does not grow with every edit
+    entry_name = hashlib.sha1(
+        repr((os.path.abspath(path), variant)).encode()
+    ).hexdigest()
+    cache_file = os.path.join(cache_directory, entry_name + ".pkl")
+
+    try:
+        with open(cache_file, "rb") as f:
+            cached_stamp, result = pickle.load(f)
+        if cached_stamp == stamp:
+            return result
+    except Exception:
+        # Missing, corrupted or incompatible: load it again
+        pass
+
+    result = loader(path)
+
+    try:
+        os.makedirs(cache_directory, exist_ok=True)
+        fd, temp_file = tempfile.mkstemp(dir=cache_directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((stamp, result), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_file, cache_file)
+        except BaseException:
+            os.unlink(temp_file)
+            raise
+    except (OSError, pickle.PicklingError):
+        # The cache is only an optimization
+        pass
+
+    return result
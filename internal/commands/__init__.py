@@ -1,9 +1,22 @@
-from .gen import command_gen
-from .invoke import command_invoke
-from .clean import command_clean
-from .export import command_export
-from .make_public import command_make_public
-from .verify import command_verify
+import importlib
+
+# The commands are imported on first access, so that running one command does not import the others
+_COMMAND_MODULES = {
+    "command_gen": ".gen",
+    "command_invoke": ".invoke",
+    "command_clean": ".clean",
+    "command_export": ".export",
+    "command_make_public": ".make_public",
+    "command_verify": ".verify",
+}
+
+
+def __getattr__(name: str):
+    if name in _COMMAND_MODULES:
+        module = importlib.import_module(_COMMAND_MODULES[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "command_gen",
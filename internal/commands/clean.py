@@ -8,6 +8,9 @@ from internal.steps.validation import ValidationStep
 from internal.steps.solution import get_solution_step_type
 from internal.steps.checker import get_checker_step_type
 
+_YES_ANSWERS = frozenset(["y", "yes"])
+_NO_ANSWERS = frozenset(["n", "no"])
+
 
 def command_clean(*, formatter: Formatter, context: TMTContext, skip_confirm: bool):
     context.log_directory = None
@@ -19,16 +22,20 @@ def command_clean(*, formatter: Formatter, context: TMTContext, skip_confirm: bo
 
         formatter.print(message + "? [Y/n] ")
         while True:
-            yesno = input().strip().lower()
-            if yesno in ["y", "yes"]:
+            try:
+                yesno = input().strip().lower()
+            except EOFError:
+                # Nobody can answer (for example, stdin is not attached in CI), so nothing is removed
+                formatter.println()
+                return False
+            if yesno in _YES_ANSWERS:
                 return True
-            if yesno in ["n", "no"]:
+            if yesno in _NO_ANSWERS:
                 return False
             formatter.print("Please answer yes or no. [Y/n] ")
 
     if confirm("Cleanup logs and sandbox"):
-        if os.path.exists(context.path.logs):
-            shutil.rmtree(context.path.logs)
+        context.path.clean_logs()
         if os.path.exists(context.path.sandbox):
             shutil.rmtree(context.path.sandbox)
 
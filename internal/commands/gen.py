@@ -1,9 +1,11 @@
-import pathlib
+import concurrent.futures
+from dataclasses import dataclass
 import os
-import hashlib
 import json
 import filecmp
+import queue
 import shutil
+from typing import Any, Iterator
 
 from internal.formatting import Formatter
 from internal.context import (
@@ -11,8 +13,9 @@ from internal.context import (
     TMTContext,
     SandboxDirectory,
 )
-from internal.exceptions import TMTInvalidConfigError
+from internal.hashing import sha256_file
 from internal.outcomes import (
+    EXECUTION_SUCCESS_OUTCOMES,
     CompilationResult,
     EvaluationResult,
     ExecutionOutcome,
@@ -21,13 +24,51 @@ from internal.outcomes import (
     eval_outcome_to_run_outcome,
 )
 
+from internal.recipe_parser import RecipeData
 from internal.steps.generation import GenerationStep
-from internal.steps.utils import CompilationJob, CompilationSlot
+from internal.steps.utils import (
+    CompilationJob,
+    CompilationSlot,
+    run_compilation_jobs,
+)
 from internal.steps.validation import ValidationStep
 from internal.steps.solution import SolutionStep, get_solution_step_type
 from internal.steps.checker import CheckerStep, get_checker_step_type
 
 
+@dataclass
+class GenerationTask:
+    """
+    A testcase to be generated, flattened from the recipe so that generation only reads its fields.
+    """
+
+    codename: str
+    extra_files: list[str]
+    generation_commands: list[list[str]]
+    validation_commands: list[list[str]]
+
+
+def make_generation_tasks(recipe: RecipeData) -> list[GenerationTask]:
+    """
+    Flattens the testcases of the recipe into generation tasks, in order.
+    """
+    tasks: list[GenerationTask] = []
+    for testset in recipe.testsets.values():
+        extra_files = list(testset.extra_file)
+        for test in testset.testcases:
+            assert test.name is not None, "codename should not be None here"
+            tasks.append(
+                GenerationTask(
+                    codename=test.name,
+                    extra_files=extra_files,
+                    generation_commands=test.execute.commands,
+                    # Piped validations are already rejected by the recipe parser
+                    validation_commands=[exe.commands[0] for exe in test.validation],
+                )
+            )
+    return tasks
+
+
 def gen_single(
     *,
     context: TMTContext,
@@ -38,11 +79,10 @@ def gen_single(
     checker_step: CheckerStep | None,
     codename_display_width: int,
     show_reason: bool,
-    testset,
-    test,
+    check_answer: dict[bool, bool],
+    task: GenerationTask,
 ):
-    codename = test.name
-    assert codename is not None, "codename should not be None here"
+    codename = task.codename
 
     formatter.print(" " * 4)
     formatter.print_fixed_width(codename, width=codename_display_width)
@@ -50,7 +90,7 @@ def gen_single(
     # Run generator
     formatter.print("gen ")
     result = generation_step.run_generator(
-        test.execute.commands, codename, list(testset.extra_file)
+        task.generation_commands, codename, task.extra_files
     )
     formatter.print_exec_result(result.input_generation)
 
@@ -59,13 +99,8 @@ def gen_single(
     if result.input_generation is not ExecutionOutcome.SUCCESS:
         result.input_validation = ExecutionOutcome.SKIPPED
     else:
-        validation_commands = []
-        for exe in test.validation:
-            if len(exe.commands) != 1:
-                raise TMTInvalidConfigError("Validation with pipe is not supported.")
-            validation_commands.append(exe.commands[0])
         validation_step.run_validator(
-            result, validation_commands, codename, list(testset.extra_file)
+            result, task.validation_commands, codename, task.extra_files
         )
     formatter.print_exec_result(result.input_validation)
 
@@ -90,7 +125,11 @@ def gen_single(
         result.reason = solution_result.reason
 
         if solution_result.output_file is not None:
-            shutil.copy(solution_result.output_file, testcase_answer_file)
+            # The sandbox output is unlinked before the next run, so the answer can share its inode
+            try:
+                os.link(solution_result.output_file, testcase_answer_file)
+            except OSError:
+                shutil.copyfile(solution_result.output_file, testcase_answer_file)
         else:
             # Create dummy output & truncate it
             with open(testcase_answer_file, "w+b"):
@@ -98,24 +137,18 @@ def gen_single(
     formatter.print_exec_result(result.output_generation)
 
     # If both input is validated and output is available, run checker if the testcase type should apply check
-    success_verdicts = [ExecutionOutcome.SUCCESS, ExecutionOutcome.SKIPPED_SUCCESS]
 
     # Not meaningful to run / no checker
     if checker_step is None:
         result.output_validation = ExecutionOutcome.SKIPPED_SUCCESS
     # Already failed
     elif (
-        result.output_generation not in success_verdicts
-        or result.input_validation not in success_verdicts
+        result.output_generation not in EXECUTION_SUCCESS_OUTCOMES
+        or result.input_validation not in EXECUTION_SUCCESS_OUTCOMES
     ):
         result.output_validation = ExecutionOutcome.SKIPPED
     # The config explicitly asked so
-    elif (
-        result.is_output_forced and not context.config.checker.check_forced_output
-    ) or (
-        not result.is_output_forced
-        and not context.config.checker.check_generated_output
-    ):
+    elif not check_answer[result.is_output_forced]:
         result.output_validation = ExecutionOutcome.SKIPPED_SUCCESS
     else:
         assert result.output_validation == ExecutionOutcome.UNKNOWN
@@ -130,9 +163,124 @@ def gen_single(
 
     formatter.println()
 
+    # Written here rather than by the caller, so that parallel workers write their logs concurrently
+    with open(
+        os.path.join(context.path.logs_generation, f"{codename}.gen.log"),
+        "w",
+        encoding="utf-8",
+    ) as f:
+        f.write(result.reason or "")
+
     return result
 
 
+def testcase_files(context: TMTContext, task: GenerationTask) -> list[str]:
+    """
+    Returns the filenames of the files generated for the task, which are hashed.
+    """
+    return [
+        context.construct_input_filename(task.codename),
+        context.construct_output_filename(task.codename),
+        *(
+            context.construct_test_filename(task.codename, ext)
+            for ext in task.extra_files
+        ),
+    ]
+
+
+def gen_parallel(
+    *,
+    jobs: int,
+    context: TMTContext,
+    formatter: Formatter,
+    sandbox: SandboxDirectory,
+    steps: dict[str, Any],
+    tasks: list[GenerationTask],
+    **kwargs,
+) -> Iterator[tuple[GenerationResult, dict[str, str] | None]]:
+    """
+    Runs :func:`gen_single` for every task with a pool of workers, each of them running in its own sandbox.
+    The results are yielded, and the outputs are printed, in the same order as the tasks.
+
+    The workers also hash the files of each successfully generated testcase, so hashing overlaps with generation.
+    Each result is yielded with the hashes of its files, or None if it failed.
+
+    Args:
+        jobs: The maximum number of workers; no more workers than tasks are started.
+        steps: The compiled steps, passed to :func:`gen_single` as keyword arguments.
+        tasks: The testcases to generate.
+        kwargs: Other keyword arguments passed to :func:`gen_single`.
+    """
+    if not tasks:
+        return
+    workers = min(jobs, len(tasks))
+    worker_sandbox_dirs = [
+        context.path.worker_sandbox(worker_id) for worker_id in range(workers)
+    ]
+    idle_workers: queue.SimpleQueue[dict[str, Any]] = queue.SimpleQueue()
+    for worker_sandbox_dir in worker_sandbox_dirs:
+        worker_sandbox = sandbox.for_worker(worker_sandbox_dir)
+        worker_sandbox.create()
+        idle_workers.put(
+            {
+                name: step.with_sandbox(worker_sandbox) if step is not None else None
+                for name, step in steps.items()
+            }
+        )
+
+    testcases_dir = context.path.testcases
+
+    def run(
+        task: GenerationTask,
+    ) -> tuple[Formatter, GenerationResult, dict[str, str] | None]:
+        worker_steps = idle_workers.get()
+        worker_formatter = formatter.captured()
+        try:
+            result = gen_single(
+                context=context,
+                formatter=worker_formatter,
+                task=task,
+                **worker_steps,
+                **kwargs,
+            )
+        finally:
+            idle_workers.put(worker_steps)
+        hashes = None
+        if result:
+            hashes = {
+                file: sha256_file(os.path.join(testcases_dir, file))
+                for file in testcase_files(context, task)
+            }
+        return worker_formatter, result, hashes
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run, task) for task in tasks]
+            try:
+                for future in futures:
+                    worker_formatter, result, hashes = future.result()
+                    formatter.print_captured(worker_formatter)
+                    yield result, hashes
+            finally:
+                for future in futures:
+                    future.cancel()
+    finally:
+        # Only after every worker has stopped; the default sandbox is kept for inspection
+        for worker_sandbox_dir in worker_sandbox_dirs:
+            shutil.rmtree(worker_sandbox_dir, ignore_errors=True)
+
+
+def _write_file_atomically(path: str, content: str) -> None:
+    """
+    Writes content to path with a single write, replacing the file only once it is complete,
+    so that an interrupted run never leaves a truncated file behind.
+    """
+    temp_file = path + ".tmp"
+    with open(temp_file, "w") as f:
+        f.write(content)
+    os.replace(temp_file, path)
+
+
 class CommandGenSummary:
     def __init__(self):
         self.testcase_results: dict[str, GenerationResult | None] = {}
@@ -157,21 +305,22 @@ class CommandGenSummary:
 
 
 def command_gen(
-    *, formatter: Formatter, context: TMTContext, verify_hash: bool, show_reason: bool
+    *,
+    formatter: Formatter,
+    context: TMTContext,
+    verify_hash: bool,
+    show_reason: bool,
+    jobs: int = 1,
 ) -> CommandGenSummary:
-    """Generate test cases in the given directory."""
-    context.set_log_directory(context.path.logs_generation)
+    """
+    Generate test cases in the given directory.
 
+    If jobs is greater than 1, the testcases are generated in parallel by that many workers.
+    """
     summary = CommandGenSummary()
 
-    # TODO when multiprocess generation is used, reflect this sandbox usage
-    sandbox = SandboxDirectory(context.path.default_sandbox)
-    sandbox.create()
-
-    if verify_hash and not (
-        os.path.exists(context.path.testcases_hashes)
-        and os.path.isfile(context.path.testcases_hashes)
-    ):
+    # Fail before touching the sandbox or compiling anything
+    if verify_hash and not os.path.isfile(context.path.testcases_hashes):
         formatter.println(
             formatter.ANSI_RED,
             "Testcase hashes does not exist. There is nothing to verify.",
@@ -180,8 +329,14 @@ def command_gen(
         summary.hash_mismatch = True
         return summary
 
+    tasks = make_generation_tasks(context.recipe)
+
+    context.set_log_directory(context.path.logs_generation)
+
+    sandbox = SandboxDirectory(context.path.default_sandbox)
+    sandbox.create()
+
     context.path.clean_logs()
-    os.makedirs(context.path.logs)
     os.makedirs(context.path.logs_generation, exist_ok=True)
 
     # Init all steps
@@ -219,6 +374,14 @@ def command_gen(
         if checker_step.use_default_checker:
             checker_step = None
 
+    # Whether the checker should check an answer, indexed by whether the answer is forced by the generator
+    check_answer: dict[bool, bool] = {}
+    if checker_step is not None:
+        check_answer = {
+            True: context.config.checker.check_forced_output,
+            False: context.config.checker.check_generated_output,
+        }
+
     # Compile steps
     def compilation_jobs():
         yield CompilationJob(CompilationSlot.GENERATOR, generation_step.compile, "")
@@ -229,125 +392,154 @@ def command_gen(
                 CompilationSlot.CHECKER, checker_step.compile, checker_step.checker_name
             )
 
-    for job in compilation_jobs():
-        formatter.print(f"{job.slot.value.ljust(10)}  compile ")
-        result = job.compile_fn()
-        summary.compilation_result[job.slot] = result
-        formatter.print_compile_result(result, name=job.display_file)
-        if not result:
-            return summary
+    if not run_compilation_jobs(
+        compilation_jobs(),
+        formatter=formatter,
+        compilation_result=summary.compilation_result,
+    ):
+        return summary
 
     # TODO: in case of update testcases, these should be mkdir
     # instead of mkdir_clean.
     context.path.clean_testcases()
     os.makedirs(context.path.testcases, exist_ok=True)
-    pathlib.Path(context.path.testcase_summary).touch()
 
+    steps = {
+        "generation_step": generation_step,
+        "validation_step": validation_step,
+        "solution_step": solution_step,
+        "checker_step": checker_step,
+    }
     codename_display_width: int = (
-        max(6, max(map(len, context.recipe.get_all_test_names()), default=0)) + 2
+        max(6, max((len(task.codename) for task in tasks), default=0)) + 2
     )
-
-    # Execute steps
-    with open(context.path.testcase_summary, "wt") as testcase_summary_file:
-        summary.testcase_summary_path = context.path.testcase_summary
-
-        for testset in context.recipe.testsets.values():
-            for test in testset.testcases:
-                result = gen_single(
+    if jobs > 1:
+        results = gen_parallel(
+            jobs=jobs,
+            context=context,
+            formatter=formatter,
+            sandbox=sandbox,
+            steps=steps,
+            tasks=tasks,
+            codename_display_width=codename_display_width,
+            show_reason=show_reason,
+            check_answer=check_answer,
+        )
+    else:
+        # The files are hashed after all testcases are generated
+        results = (
+            (
+                gen_single(
                     context=context,
                     formatter=formatter,
                     codename_display_width=codename_display_width,
-                    generation_step=generation_step,
-                    validation_step=validation_step,
-                    solution_step=solution_step,
-                    checker_step=checker_step,
                     show_reason=show_reason,
-                    testset=testset,
-                    test=test,
-                )
-                codename = test.name
-                assert codename is not None
+                    check_answer=check_answer,
+                    task=task,
+                    **steps,
+                ),
+                None,
+            )
+            for task in tasks
+        )
 
-                with open(
-                    os.path.join(context.path.logs_generation, f"{codename}.gen.log"),
-                    "w+",
-                ) as f:
-                    f.write(result.reason)
+    # Files to be hashed, in the order of the testcases
+    all_testcase_files: list[str] = []
+    testcase_hashes: dict[str, str] = {}
+    # Lines of the testcase summary, written at once after all testcases are generated
+    testcase_summary_lines: list[str] = []
 
-                summary.testcase_results[codename] = result
-                if not result:
-                    continue
+    # Execute steps
+    for task, (result, hashes) in zip(tasks, results):
+        codename = task.codename
 
-                # TODO: this should print more meaningful contents, right now it is only the testcases
-                testcase_summary_file.write(f"{codename}\n")
-                for testcase_file_exts in [
-                    context.config.input_extension,
-                    context.config.output_extension,
-                ] + list(testset.extra_file):
-                    base_filename = context.construct_test_filename(
-                        codename, testcase_file_exts
-                    )
-                    file = os.path.join(context.path.testcases, base_filename)
-                    with open(file, "rb") as f:
-                        summary.testcase_hashes[base_filename] = hashlib.sha256(
-                            f.read()
-                        ).hexdigest()
-
-        if verify_hash:
-            formatter.println()
-            with open(context.path.testcases_hashes, "r") as f:
-                official_testcase_hashes: dict[str, str] = json.load(f)
-            formatter.print_hash_diff(official_testcase_hashes, summary.testcase_hashes)
-            summary.hash_mismatch = official_testcase_hashes != summary.testcase_hashes
-        else:
-            # Dump hashes first
-            with open(context.path.testcases_hashes, "w") as f:
-                json.dump(summary.testcase_hashes, f, sort_keys=True, indent=4)
-                f.write("\n")
-
-            # Duplicated test detection
-            input_hashes: dict[str, list[str]] = {}
-            for file, hash in summary.testcase_hashes.items():
-                if file.endswith(context.config.input_extension):
-                    if hash not in input_hashes:
-                        input_hashes[hash] = []
-                    input_hashes[hash].append(file)
-
-            dupe_hashes = {
-                hash: filelist
-                for hash, filelist in input_hashes.items()
-                if len(filelist) > 1
-            }
-            if not len(dupe_hashes):
-                return summary
+        summary.testcase_results[codename] = result
+        if not result:
+            continue
 
-            # Warn for same input hashes
-            formatter.println(
-                formatter.ANSI_YELLOW,
-                "Warning: same hash value for input files detected:",
-            )
-            for hash, filelist in dupe_hashes.items():
-                formatter.println(f"    {hash}: {', '.join(filelist)}")
-            formatter.println(
-                "Please make sure the possibly duplicated test is intended.",
-                formatter.ANSI_RESET,
+        # TODO: this should print more meaningful contents, right now it is only the testcases
+        testcase_summary_lines.append(f"{codename}\n")
+        all_testcase_files += testcase_files(context, task)
+        if hashes is not None:
+            testcase_hashes.update(hashes)
+
+    _write_file_atomically(
+        context.path.testcase_summary, "".join(testcase_summary_lines)
+    )
+    summary.testcase_summary_path = context.path.testcase_summary
+
+    # Hashing releases the GIL, so the files can be hashed in parallel with threads;
+    # the default pool size has a few more threads than CPUs, to keep them busy while others wait for the disk
+    testcases_dir = context.path.testcases
+    unhashed_files = [f for f in all_testcase_files if f not in testcase_hashes]
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        testcase_hashes.update(
+            zip(
+                unhashed_files,
+                executor.map(
+                    sha256_file,
+                    (os.path.join(testcases_dir, f) for f in unhashed_files),
+                ),
             )
+        )
+    summary.testcase_hashes = {f: testcase_hashes[f] for f in all_testcase_files}
+
+    if verify_hash:
+        formatter.println()
+        with open(context.path.testcases_hashes, "r") as f:
+            official_testcase_hashes: dict[str, str] = json.load(f)
+        formatter.print_hash_diff(official_testcase_hashes, summary.testcase_hashes)
+        summary.hash_mismatch = official_testcase_hashes != summary.testcase_hashes
+    else:
+        # Dump hashes first
+        _write_file_atomically(
+            context.path.testcases_hashes,
+            json.dumps(summary.testcase_hashes, sort_keys=True, indent=4) + "\n",
+        )
+
+        # Duplicated test detection
+        input_hashes: dict[str, list[str]] = {}
+        for file, hash in summary.testcase_hashes.items():
+            if file.endswith(context.config.input_extension):
+                if hash not in input_hashes:
+                    input_hashes[hash] = []
+                input_hashes[hash].append(file)
+
+        dupe_hashes = {
+            hash: filelist
+            for hash, filelist in input_hashes.items()
+            if len(filelist) > 1
+        }
+        if not len(dupe_hashes):
+            return summary
 
-            # Addtional check for actual file content
-            for hash, filelist in dupe_hashes.items():
-                for i in range(len(filelist) - 1):
-                    if filecmp.cmp(
-                        os.path.join(context.path.testcases, filelist[i]),
-                        os.path.join(context.path.testcases, filelist[i + 1]),
-                        shallow=False,
-                    ):
-                        continue
-                    # SHA-256 collision?
-                    formatter.println(
-                        formatter.ANSI_RED_BG,
-                        f"You found a SHA-256 hash collision: {filelist[i]} and {filelist[i + 1]}. "
-                        "You should check whether your disk and RAM are still working properly.",
-                        formatter.ANSI_RESET,
-                    )
+        # Warn for same input hashes
+        formatter.println(
+            formatter.ANSI_YELLOW,
+            "Warning: same hash value for input files detected:",
+        )
+        for hash, filelist in dupe_hashes.items():
+            formatter.println(f"    {hash}: {', '.join(filelist)}")
+        formatter.println(
+            "Please make sure the possibly duplicated test is intended.",
+            formatter.ANSI_RESET,
+        )
+
+        # Addtional check for actual file content
+        for hash, filelist in dupe_hashes.items():
+            for i in range(len(filelist) - 1):
+                if filecmp.cmp(
+                    os.path.join(context.path.testcases, filelist[i]),
+                    os.path.join(context.path.testcases, filelist[i + 1]),
+                    shallow=False,
+                ):
+                    continue
+                # SHA-256 collision?
+                formatter.println(
+                    formatter.ANSI_RED_BG,
+                    f"You found a SHA-256 hash collision: {filelist[i]} and {filelist[i + 1]}. "
+                    "You should check whether your disk and RAM are still working properly.",
+                    formatter.ANSI_RESET,
+                )
 
     return summary
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
-import pathlib
 import os
+import shutil
 import subprocess
 
 from internal.formatting import Formatter
@@ -9,12 +9,18 @@ from internal.outcomes import (
     CompilationResult,
     EvaluationOutcome,
     EvaluationResult,
+    SingleCompilationResult,
     eval_outcome_to_run_outcome,
 )
 import internal.recipe_parser as recipe_parser
 from internal.steps.checker import get_checker_step_type
 from internal.steps.solution import get_solution_step_type
-from internal.steps.utils import CompilationJob, CompilationSlot
+from internal.steps.utils import (
+    CompilationJob,
+    CompilationSlot,
+    run_compilation_jobs,
+)
+from internal.verdict_cache import VerdictCache
 
 
 def is_apport_active():
@@ -30,6 +36,17 @@ def is_apport_active():
         return False  # systemctl not available
 
 
+def _log_stamps(log_directory: str) -> dict[str, tuple[int, int]]:
+    """
+    Returns the inode and modification time of every entry in the log directory, to find the logs written by a run.
+    """
+    stamps = {}
+    for entry in os.scandir(log_directory):
+        stat = entry.stat(follow_symlinks=False)
+        stamps[entry.name] = (stat.st_ino, stat.st_mtime_ns)
+    return stamps
+
+
 class CommandInvokeSummary:
     def __init__(self):
         self.testcase_results: dict[str, EvaluationResult | None] = {}
@@ -126,7 +143,14 @@ def command_invoke(
     context: TMTContext,
     show_reason: bool,
     submission_files: list[str],
+    use_cache: bool = True,
 ) -> CommandInvokeSummary:
+    """
+    Invoke the submission on the generated testcases.
+
+    By default, as in the CLI, the results are cached, and the submission is not run again on testcases whose result is cached.
+    If use_cache is unset, the submission is run on every testcase.
+    """
     context.set_log_directory(context.path.logs_invocation)
 
     sandbox = SandboxDirectory(context.path.default_sandbox)
@@ -136,10 +160,7 @@ def command_invoke(
 
     summary = CommandInvokeSummary()
 
-    if not (
-        os.path.exists(context.path.testcase_summary)
-        and os.path.isfile(context.path.testcase_summary)
-    ):
+    if not os.path.isfile(context.path.testcase_summary):
         formatter.println(
             formatter.ANSI_RED,
             "Testcase summary does not exist. Please generate the testcases first.",
@@ -148,15 +169,14 @@ def command_invoke(
         return summary.directory_fail()
 
     with open(context.path.testcase_summary, "rt") as testcases_summary:
-        available_testcases = [line.strip() for line in testcases_summary.readlines()]
+        available_testcases = [line.strip() for line in testcases_summary]
+    available_testcase_set = frozenset(available_testcases)
     unavailable_testcases = [
         testcase
         for testcase in context.recipe.get_all_test_names()
-        if available_testcases.count(testcase) == 0
+        if testcase not in available_testcase_set
     ]
 
-    assert pathlib.Path(context.path.testcase_summary).exists()
-
     # Make every steps first
     solution_step_type = get_solution_step_type(
         problem_type=context.config.problem_type,
@@ -189,26 +209,28 @@ def command_invoke(
                 CompilationSlot.CHECKER, checker_step.compile, checker_step.checker_name
             )
 
-    for job in compilation_jobs():
-        formatter.print(f"{job.slot.value.ljust(10)}  compile ")
-        result = job.compile_fn()
-        summary.compilation_result[job.slot] = result
-        formatter.print_compile_result(result, name=job.display_file)
-        if not result:
-            return summary
-
-    all_testcases = [
-        test.name
-        for testset in context.recipe.testsets.values()
-        for test in testset.testcases
-    ]
-    with open(context.path.testcase_summary, "rt") as testcases_summary:
-        available_testcases = [line.strip() for line in testcases_summary.readlines()]
-    unavailable_testcases = [
-        testcase
-        for testcase in all_testcases
-        if testcase is not None and available_testcases.count(testcase) == 0
-    ]
+    if not run_compilation_jobs(
+        compilation_jobs(),
+        formatter=formatter,
+        compilation_result=summary.compilation_result,
+    ):
+        return summary
+
+    verdict_cache: VerdictCache | None = None
+    # Directories (for example, output-only submissions) are not hashed
+    if use_cache and all(map(os.path.isfile, actual_files)):
+        produced_files = [
+            result.produced_file
+            for result in summary.compilation_result.values()
+            if isinstance(result, SingleCompilationResult)
+            and result.produced_file is not None
+        ]
+        verdict_cache = VerdictCache(
+            context.path.verdict_cache,
+            [context.path.problem_yaml, context.path.compiler_yaml]
+            + actual_files
+            + produced_files,
+        )
 
     if len(unavailable_testcases):
         formatter.println(
@@ -229,34 +251,90 @@ def command_invoke(
 
     os.makedirs(context.path.logs_invocation, exist_ok=True)
 
-    for codename in available_testcases:
-        formatter.print(" " * 4)
-        formatter.print_fixed_width(codename, width=codename_length)
+    # Hoisted out of the loop below; each path property joins its path on every access
+    testcases_dir = context.path.testcases
+    logs_invocation_dir = context.path.logs_invocation
+    # The config guarantees that both extensions start with a dot
+    input_extension = context.config.input_extension
+    output_extension = context.config.output_extension
+
+    # Bound once, since the loop below calls them several times per testcase
+    print_text = formatter.print
+    print_fixed_width = formatter.print_fixed_width
+    print_exec_result = formatter.print_exec_result
+    print_exec_details = formatter.print_exec_details
+    print_checker_status = formatter.print_checker_status
+    print_testcase_verdict = formatter.print_testcase_verdict
+    println = formatter.println
 
-        formatter.print("sol ")
-        solution_result = solution_step.run_solution(codename)
+    for codename in available_testcases:
+        print_text(" " * 4)
+        print_fixed_width(codename, width=codename_length)
+
+        cache_key = cached_result = None
+        if verdict_cache is not None:
+            cache_key = verdict_cache.key(
+                [
+                    os.path.join(testcases_dir, codename + input_extension),
+                    os.path.join(testcases_dir, codename + output_extension),
+                ]
+            )
+            cached_result = verdict_cache.get(cache_key)
+
+        sol_log_name = f"{codename}.sol.log"
+        log_stamps = None
+        print_text("sol ")
+        if cached_result is not None:
+            solution_result = cached_result
+            # The logs of the run that was cached would not describe this result
+            for log_name in verdict_cache.log_files(cache_key):
+                log_path = os.path.join(logs_invocation_dir, log_name)
+                if os.path.isdir(log_path):
+                    shutil.rmtree(log_path, ignore_errors=True)
+                elif os.path.lexists(log_path):
+                    os.unlink(log_path)
+        else:
+            if verdict_cache is not None:
+                log_stamps = _log_stamps(logs_invocation_dir)
+            solution_result = solution_step.run_solution(codename)
 
-        formatter.print_exec_result(eval_outcome_to_run_outcome(solution_result))
-        formatter.print_exec_details(solution_result, context=context)
+        print_exec_result(eval_outcome_to_run_outcome(solution_result))
+        print_exec_details(solution_result, context=context)
 
         with open(
-            os.path.join(context.path.logs_invocation, f"{codename}.sol.log"), "w+"
+            os.path.join(logs_invocation_dir, sol_log_name),
+            "w",
+            encoding="utf-8",
         ) as f:
-            f.write(solution_result.reason)
+            f.write(solution_result.reason or "")
 
+        if cached_result is not None:
+            print_text("cache ")
         # TODO option to skip_checker
-        if checker_step is not None:
-            formatter.print("check ")
+        elif checker_step is not None:
+            print_text("check ")
             solution_result = checker_step.run_checker(solution_result, codename)
 
-        formatter.print_checker_status(solution_result)
-        formatter.print_testcase_verdict(
+        if verdict_cache is not None and log_stamps is not None:
+            # The solution log is written from the result, also when it is cached
+            log_files = [
+                log_name
+                for log_name, stamp in _log_stamps(logs_invocation_dir).items()
+                if log_stamps.get(log_name) != stamp and log_name != sol_log_name
+            ]
+            verdict_cache.put(cache_key, solution_result, log_files=log_files)
+
+        print_checker_status(solution_result)
+        print_testcase_verdict(
             solution_result, context=context, print_reason=show_reason
         )
-        formatter.println()
+        println()
 
         summary.testcase_results[codename] = solution_result
 
+    if verdict_cache is not None:
+        verdict_cache.save()
+
     testset_results: dict[str, TestsetResult] = {}
 
     def init_result(testset: recipe_parser.Testset | recipe_parser.Subtask):
@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+from internal.hashing import sha256_file
+from internal.outcomes import CompilationOutcome, SingleCompilationResult
+
+from .languages.base import Language, MakeInfo
+
+# The environment variables read by the Makefiles
+_MAKE_ENVIRONMENT = ["CXX", "CXXFLAGS", "PYTHON", "MAKE", "MAKEFLAGS"]
+# The tools whose installation affects the produced executables, with their defaults
+_TOOLS = {"CXX": "g++", "PYTHON": "python3"}
+
+
+def _files_under(directory: str) -> list[str]:
+    """
+    Returns every regular file under directory recursively, sorted, except those in build directories.
+    """
+    files = []
+    for root, dirs, filenames in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if d != "build")
+        files += sorted(os.path.join(root, f) for f in filenames)
+    return [f for f in files if os.path.isfile(f)]
+
+
+def compile_cache_key(
+    *,
+    lang: Language,
+    make_info: MakeInfo,
+    directory: str,
+    sources: list[str],
+    target: str,
+    executable_stack_size_mib: int,
+) -> str:
+    """
+    Returns the digest of everything that may affect compiling target in directory:
+    the sources in their order, the files in directory and in the include paths, the Makefile with its environment, and the installed tools.
+    """
+    digest = hashlib.sha256()
+
+    def add(*parts):
+        digest.update(json.dumps(parts).encode())
+
+    add(lang.id, target, sources, executable_stack_size_mib)
+    add(make_info.makefile, sha256_file(make_info.makefile))
+    add(sorted(make_info.extra_env.items()))
+    add([os.environ.get(name) for name in _MAKE_ENVIRONMENT])
+    for name, default in _TOOLS.items():
+        tool = shutil.which(os.environ.get(name, default))
+        if tool is not None:
+            stat = os.stat(tool)
+            add(os.path.realpath(tool), stat.st_size, stat.st_mtime_ns)
+
+    roots = [directory] + make_info.extra_env.get("INCLUDE_PATHS", "").split()
+    for root in roots:
+        for file in _files_under(root):
+            add(os.path.relpath(file, root), sha256_file(file))
+    return digest.hexdigest()
+
+
+class CompileCache:
+    """
+    Keeps the executables of successful compilations, so that unchanged sources are not compiled again.
+
+    Each entry consists of the executable and a JSON file of the compilation result, both named by the cache key.
+    Only the most recently used entries are kept.
+    """
+
+    MAX_ENTRIES = 64
+
+    def __init__(self, cache_directory: str):
+        self.cache_directory = cache_directory
+
+    def _entry(self, key: str) -> tuple[str, str]:
+        executable = os.path.join(self.cache_directory, key)
+        return executable, executable + ".json"
+
+    def get(self, key: str, produced_file: str) -> SingleCompilationResult | None:
+        """
+        Copies the cached executable to produced_file and returns the cached result, or returns None if it is not cached.
+        """
+        executable, metadata = self._entry(key)
+        try:
+            with open(metadata, "r") as f:
+                entry = json.load(f)
+            os.makedirs(os.path.dirname(produced_file), exist_ok=True)
+            shutil.copy2(executable, produced_file)
+            os.utime(metadata)  # Marks the entry as recently used
+        except (OSError, ValueError):
+            return None
+        return SingleCompilationResult(
+            verdict=CompilationOutcome.SUCCESS,
+            standard_output=entry.get("standard_output", ""),
+            standard_error=entry.get("standard_error", ""),
+            produced_file=produced_file,
+        )
+
+    def put(self, key: str, result: SingleCompilationResult) -> None:
+        """
+        Stores the result if the compilation succeeded.
+        """
+        if result.verdict is not CompilationOutcome.SUCCESS or not result.produced_file:
+            return
+        os.makedirs(self.cache_directory, exist_ok=True)
+        executable, metadata = self._entry(key)
+
+        # Both files are moved into place atomically; the metadata is moved last, since it marks the entry as complete
+        temp_executable = self._temp_file()
+        shutil.copy2(result.produced_file, temp_executable)
+        os.replace(temp_executable, executable)
+
+        temp_metadata = self._temp_file()
+        with open(temp_metadata, "w") as f:
+            json.dump(
+                {
+                    "standard_output": result.standard_output,
+                    "standard_error": result.standard_error,
+                },
+                f,
+            )
+        os.replace(temp_metadata, metadata)
+
+        self._evict()
+
+    def _temp_file(self) -> str:
+        fd, temp_file = tempfile.mkstemp(dir=self.cache_directory, suffix=".tmp")
+        os.close(fd)
+        return temp_file
+
+    def _evict(self) -> None:
+        entries = []
+        for entry in os.scandir(self.cache_directory):
+            if entry.name.endswith(".json"):
+                try:
+                    entries.append((entry.stat().st_mtime_ns, entry.path))
+                except FileNotFoundError:
+                    pass
+        entries.sort(reverse=True)
+        for _, metadata in entries[self.MAX_ENTRIES :]:
+            for file in (metadata, metadata.removesuffix(".json")):
+                try:
+                    os.unlink(file)
+                except FileNotFoundError:
+                    pass
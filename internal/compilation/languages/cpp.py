@@ -1,5 +1,6 @@
 import os
 import platform
+import shutil
 
 from .base import MakeInfo
 from .executable import ExecutableLanguage
@@ -27,10 +28,35 @@ class LanguageCpp(ExecutableLanguage):
             ]
         return []
 
+    def _get_compiler_launcher_env(self) -> dict[str, str]:
+        """
+        Routes the compiler through ccache (or sccache) if it is installed, so that unchanged sources are not compiled again.
+        If DISTCC_HOSTS is set and distcc is installed, the compilations are also distributed to those hosts.
+        A CXX from the environment takes precedence over this.
+        """
+        distcc = shutil.which("distcc") if os.environ.get("DISTCC_HOSTS") else None
+        launcher = shutil.which("ccache")
+        if launcher is not None:
+            env = {
+                "CXX": f"{launcher} g++",
+                # Lets the problem directory be moved without losing the cached results
+                "CCACHE_BASEDIR": self.context.path.problem_dir,
+            }
+            if distcc is not None:
+                # ccache runs the compiler through distcc on a cache miss
+                env["CCACHE_PREFIX"] = distcc
+            return env
+        # sccache cannot hand the compilation over to distcc
+        launcher = distcc or shutil.which("sccache")
+        if launcher is None:
+            return {}
+        return {"CXX": f"{launcher} g++"}
+
     def _construct_make_env(self, executable_stack_mib: int) -> dict[str, str]:
-        compile_flags = self.context.compile_flags(self.id)
+        # Copied, so that the flags from compiler.yaml are not extended again on every call
+        compile_flags = list(self.context.compile_flags(self.id))
         compile_flags += self._get_stack_size_args(executable_stack_mib)
-        return {
+        return self._get_compiler_launcher_env() | {
             "CXXFLAGS": " ".join(compile_flags),
             "INCLUDE_PATHS": self.context.path.include,
         }
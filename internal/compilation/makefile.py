@@ -2,6 +2,9 @@ import subprocess
 import shutil
 import os
 import glob
+import functools
+import platform
+import resource
 
 from internal.context import TMTContext
 from internal.outcomes import (
@@ -12,10 +15,43 @@ from internal.outcomes import (
 from internal.process import Process, wait_for_outputs
 from internal.exceptions import TMTMissingFileError
 
+from .cache import CompileCache, compile_cache_key
 from .languages import languages
 from .utils import recognize_language
 
 
+def _get_make_jobs() -> int:
+    """
+    Returns the number of jobs make may run at once, one for each CPU unless TMT_MAX_MAKE_JOBS says otherwise.
+    Several compilations may already run concurrently, so TMT_MAX_MAKE_JOBS can lower this to avoid oversubscription,
+    or raise it when the compilations are distributed to other hosts.
+    """
+    if max_jobs := os.environ.get("TMT_MAX_MAKE_JOBS"):
+        try:
+            return max(int(max_jobs), 1)
+        except ValueError:
+            pass
+    return os.cpu_count() or 1
+
+
+def _get_make_parallel_flags() -> list[str]:
+    """
+    Returns the flags letting make build independent targets in parallel, except for those already in MAKEFLAGS.
+    Only the build itself needs them; emit-log has nothing to parallelize.
+    """
+    make_flags = os.environ.get("MAKEFLAGS", "").split()
+    jobs = _get_make_jobs()
+    parallel_flags = []
+    if not any(flag.startswith(("-j", "--jobs")) for flag in make_flags):
+        parallel_flags.append(f"-j{jobs}")
+    # Several makes may run at once, so none of them starts another job while the machine is already busy
+    if not any(
+        flag.startswith(("-l", "--load-average", "--max-load")) for flag in make_flags
+    ):
+        parallel_flags.append(f"-l{jobs}")
+    return parallel_flags
+
+
 def _get_make() -> list[str]:
     make_flags = os.environ.get("MAKEFLAGS", "").split()
 
@@ -29,6 +65,18 @@ def _get_make() -> list[str]:
     raise TMTMissingFileError("executable", "make", "PATH")
 
 
+def _limit_address_space(memory_limit_mib: int) -> None:
+    """
+    Caps the address space of make and, since resource limits are inherited, of every compiler it spawns.
+    Without this, the compilation memory limit would only bound the stack size.
+    """
+    # RLIMIT_AS is not enforced on macOS
+    if memory_limit_mib == resource.RLIM_INFINITY or platform.system() == "Darwin":
+        return
+    limit_bytes = memory_limit_mib * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, limit_bytes))
+
+
 def make_compile_wildcard(
     *, context: TMTContext, directory: str, executable_stack_size_mib: int
 ) -> CompilationResult:
@@ -38,16 +86,26 @@ def make_compile_wildcard(
     compilation_time_limit_sec = context.config.compile_time_limit_sec
     compilation_memory_limit_mib = context.config.compile_memory_limit_mib
 
-    allout = allerr = ""
+    # Joined once at the end
+    allout: list[str] = []
+    allerr: list[str] = []
 
     make_all_process: Process | None = None
 
+    # Hoisted out of the loop below; the extensions of every language are fixed
+    source_extensions = {
+        ext for lang_type in languages for ext in lang_type(context).source_extensions
+    }
+
     # First, we detect if any source files could compile to the same executable.
     # This breaks many assuptions of the tool (for example the recipe), therefore it is an immediate error.
+    # The extensions present are also recorded, so that languages without sources are skipped.
+    present_extensions: set[str] = set()
     executables: dict[str, str] = {}
     for source in glob.iglob("*", root_dir=directory):
         base, ext = os.path.splitext(source)
-        if any(ext in lang(context).source_extensions for lang in languages):
+        if ext in source_extensions:
+            present_extensions.add(ext)
             if base in executables:
                 return CompilationResult(
                     verdict=CompilationOutcome.FAILED,
@@ -60,6 +118,9 @@ def make_compile_wildcard(
     # Run every langauge's wildcard Makefile to compile all possible sources
     for lang_type in languages:
         lang = lang_type(context)
+        # There is nothing for make to do, so the two make invocations are skipped
+        if present_extensions.isdisjoint(lang.source_extensions):
+            continue
 
         make_info = lang.get_make_wildcard_command(executable_stack_size_mib)
 
@@ -78,16 +139,25 @@ def make_compile_wildcard(
             "stderr": subprocess.PIPE,
             "time_limit_sec": compilation_time_limit_sec,
             "memory_limit_mib": compilation_memory_limit_mib,
+            "kill_process_group": True,
+            "preexec_fn": functools.partial(
+                _limit_address_space, compilation_memory_limit_mib
+            ),
             "env": make_info.extra_env | os.environ,
         }
-        make_all_process = Process(command + ["all"], **kwargs)
+        make_all_process = Process(
+            command + _get_make_parallel_flags() + ["all"], **kwargs
+        )
         stdout, stderr = wait_for_outputs(make_all_process)
-        allout += stdout
-        allerr += stderr
+        allout.append(stdout)
+        allerr.append(stderr)
 
-        make_emit_log_process = Process(command + ["emit-log"], **kwargs)
+        # The logs are emitted to stderr; stdout is unused, so it is not captured
+        make_emit_log_process = Process(
+            command + ["emit-log"], **(kwargs | {"stdout": subprocess.DEVNULL})
+        )
         _, stderr = wait_for_outputs(make_emit_log_process)
-        allerr += stderr
+        allerr.append(stderr)
 
         if make_all_process.status != 0 or make_all_process.is_timedout:
             break
@@ -104,8 +174,8 @@ def make_compile_wildcard(
 
     return CompilationResult(
         verdict=verdict,
-        standard_output=allout,
-        standard_error=allerr,
+        standard_output="".join(allout),
+        standard_error="".join(allerr),
         exit_status=(make_all_process.status if make_all_process is not None else 0),
     )
 
@@ -117,11 +187,14 @@ def make_compile_target(
     sources: list[str],
     target: str,
     executable_stack_size_mib: int,
+    cache: CompileCache | None = None,
 ) -> SingleCompilationResult:
     """
     Compile the specific source file into the target executable recognized by a langauge that recognizes in the directory.
 
     This function assumes the directory is already set up for running make: it can be roughly thought as just running make in that directory with appropriate settings and returns the captured output.
+
+    If cache is given, the executable is taken from the cache instead when nothing affecting the compilation has changed.
     """
 
     compilation_time_limit_sec = context.config.compile_time_limit_sec
@@ -141,6 +214,23 @@ def make_compile_target(
     lang = lang_type(context)
     make_info = lang.get_make_target_command(executable_stack_size_mib)
 
+    executable_file = os.path.join(
+        directory, "build", target + lang.executable_extension
+    )
+    cache_key = None
+    if cache is not None:
+        cache_key = compile_cache_key(
+            lang=lang,
+            make_info=make_info,
+            directory=directory,
+            sources=sources,
+            target=target,
+            executable_stack_size_mib=executable_stack_size_mib,
+        )
+        cached_result = cache.get(cache_key, executable_file)
+        if cached_result is not None:
+            return cached_result
+
     command = _get_make() + [
         "--no-print-directory",
         "-C",
@@ -155,17 +245,25 @@ def make_compile_target(
         "stderr": subprocess.PIPE,
         "time_limit_sec": compilation_time_limit_sec,
         "memory_limit_mib": compilation_memory_limit_mib,
-        "env": make_info.extra_env
-        | os.environ
-        | {
+        "kill_process_group": True,
+        "preexec_fn": functools.partial(
+            _limit_address_space, compilation_memory_limit_mib
+        ),
+        # Built in one go, rather than through intermediate copies of the whole environment
+        "env": {
+            **make_info.extra_env,
+            **os.environ,
             "SRCS": " ".join(sources),
             "TARGET_NAME": target,
         },
     }
-    compile_process = Process(command, **kwargs)
+    compile_process = Process(command + _get_make_parallel_flags(), **kwargs)
     stdout, stderr = wait_for_outputs(compile_process)
 
-    emit_log_process = Process(command + ["emit-log"], **kwargs)
+    # The logs are emitted to stderr; stdout is unused, so it is not captured
+    emit_log_process = Process(
+        command + ["emit-log"], **(kwargs | {"stdout": subprocess.DEVNULL})
+    )
     _, emitted_log = wait_for_outputs(emit_log_process)
     stderr += emitted_log
 
@@ -177,18 +275,16 @@ def make_compile_target(
     else:
         verdict = CompilationOutcome.SUCCESS
 
-    executable_file = os.path.join(
-        directory, "build", target + lang.executable_extension
-    )
-    if not os.path.isfile(executable_file):
-        executable_file = None
-    return SingleCompilationResult(
+    result = SingleCompilationResult(
         verdict=verdict,
         standard_output=stdout,
         standard_error=stderr,
         exit_status=compile_process.status,
-        produced_file=executable_file,
+        produced_file=executable_file if os.path.isfile(executable_file) else None,
     )
+    if cache is not None:
+        cache.put(cache_key, result)
+    return result
 
 
 def make_clean(*, directory: str) -> None:
@@ -4,6 +4,7 @@ import os
 from internal.context import TMTContext
 from internal.outcomes import SingleCompilationResult
 
+from .cache import CompileCache
 from .languages import languages
 from .makefile import make_compile_target
 
@@ -38,6 +39,8 @@ def compile_single(
             The base name of the target executable.
         executable_stack_size_mib:
             The maximum size allowed for the target executable, in MiB.
+
+    The executables are cached in the sandbox, so unchanged sources are not compiled again.
     """
     # They are internal errors; the caller should resolve them into absolute path.
     if not os.path.isabs(directory):
@@ -65,6 +68,7 @@ def compile_single(
         sources=src_in_dir,
         target=executable_filename_base,
         executable_stack_size_mib=executable_stack_size_mib,
+        cache=CompileCache(context.path.compile_cache),
     )
 
 
@@ -81,7 +85,7 @@ def get_run_single_command(
         lang = lang_type(context)
 
         exe_file = exe_base + lang.executable_extension
-        if os.path.exists(exe_file) and os.path.isfile(exe_file):
+        if os.path.isfile(exe_file):
             return lang.get_execution_command(exe_base, executable_stack_size_mib)
     return None
 
@@ -1,14 +1,32 @@
+import functools
 import os
-import pathlib
 import yaml
 
 
-from internal.recipe_parser import parse_recipe_data
+import internal.recipe_parser
+from internal.cache import load_or_compute
+from internal.recipe_parser import RecipeData, parse_recipe_data
 from internal.exceptions import TMTMissingFileError, TMTInvalidConfigError
 
 from .paths import ProblemDirectoryHelper
 from .config import ProblemType, TMTConfig
 
+try:
+    # The libyaml-backed loader is much faster, but it is only available if PyYAML was built with libyaml
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+def _load_yaml(path: str):
+    with open(path, "r") as file:
+        return yaml.load(file, Loader=SafeLoader)
+
+
+def _load_recipe(path: str, is_outputonly: bool) -> RecipeData:
+    with open(path) as file:
+        return parse_recipe_data(file, is_outputonly)
+
 
 class TMTContext:
     def __init__(self, problem_dir: str, script_root: str):
@@ -16,9 +34,13 @@ class TMTContext:
         self.path = ProblemDirectoryHelper(problem_dir, script_root)
         self._log_directory: str | None = None
 
+        # The parsed files are memoized in the sandbox, since they rarely change between runs
         try:
-            with open(self.path.problem_yaml, "r") as file:
-                problem_yaml = yaml.safe_load(file)
+            problem_yaml = load_or_compute(
+                self.path.problem_yaml,
+                _load_yaml,
+                cache_directory=self.path.parse_cache,
+            )
             # self.config stores the parsed config from problem.yaml
         except (FileNotFoundError, IsADirectoryError, PermissionError) as e:
             raise TMTMissingFileError("config", self.path.problem_yaml) from e
@@ -34,20 +56,26 @@ class TMTContext:
             raise TMTInvalidConfigError(self.path.problem_yaml) from e
 
         try:
-            with open(self.path.compiler_yaml, "r") as file:
-                self.compiler_yaml = yaml.safe_load(file)
+            self.compiler_yaml = load_or_compute(
+                self.path.compiler_yaml,
+                _load_yaml,
+                cache_directory=self.path.parse_cache,
+            )
         except (FileNotFoundError, IsADirectoryError, PermissionError) as e:
             raise TMTMissingFileError("config", self.path.compiler_yaml) from e
         except yaml.YAMLError as e:
             raise TMTInvalidConfigError(self.path.compiler_yaml) from e
 
         try:
-            with open(self.path.tmt_recipe) as file:
-                # TODO: the last one feels hacky, but unless this is deferred there is no way to do this
-                self.recipe = parse_recipe_data(
-                    file.readlines(),
-                    self.config.problem_type == ProblemType.OUTPUT_ONLY,
-                )
+            # TODO: the last one feels hacky, but unless this is deferred there is no way to do this
+            is_outputonly = self.config.problem_type == ProblemType.OUTPUT_ONLY
+            self.recipe = load_or_compute(
+                self.path.tmt_recipe,
+                functools.partial(_load_recipe, is_outputonly=is_outputonly),
+                cache_directory=self.path.parse_cache,
+                variant=(is_outputonly,),
+                code_files=(internal.recipe_parser.__file__,),
+            )
         except OSError as e:
             raise TMTMissingFileError("config", self.path.tmt_recipe) from e
         except ValueError as e:
@@ -68,11 +96,12 @@ class TMTContext:
             extension = "." + extension
         return code_name + extension
 
+    # The config guarantees that its extensions start with a dot, so they are appended directly
     def construct_input_filename(self, code_name: str):
-        return self.construct_test_filename(code_name, self.config.input_extension)
+        return code_name + self.config.input_extension
 
     def construct_output_filename(self, code_name: str):
-        return self.construct_test_filename(code_name, self.config.output_extension)
+        return code_name + self.config.output_extension
 
     # TODO: find a better solution to maintain the current log_directory
     @property
@@ -106,11 +135,19 @@ class TMTContext:
         return os.path.join(self.log_directory, filename)
 
 
-def find_problem_dir(cwd: pathlib.Path) -> str:
-
-    for directory in [cwd] + list(cwd.parents):
-        if (directory / ProblemDirectoryHelper.PROBLEM_YAML).exists():
-            return str(directory.resolve())
+def find_problem_dir(cwd: str) -> str:
+    """
+    Returns the nearest directory containing problem.yaml, searching upward from cwd.
+    """
+    problem_yaml = ProblemDirectoryHelper.PROBLEM_YAML
+    directory = os.path.abspath(cwd)
+    while True:
+        if os.path.isfile(os.path.join(directory, problem_yaml)):
+            return os.path.realpath(directory)
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            break
+        directory = parent
     raise TMTMissingFileError(
         "config",
         ProblemDirectoryHelper.PROBLEM_YAML,
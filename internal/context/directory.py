@@ -1,7 +1,6 @@
 # Implements temporary sandbox path helpers
 
 import os
-import stat
 import shutil
 
 
@@ -27,16 +26,16 @@ class Directory:
 
     def clean(self):
         """Remove everything under this directory. If the directory itself does not exist, nothing happens."""
-        if not os.path.exists(self.directory_root):
+        try:
+            entries = list(os.scandir(self.directory_root))
+        except FileNotFoundError:
             return
-        for filename in os.listdir(self.directory_root):
-            file_path = os.path.join(self.directory_root, filename)
-            if os.path.isfile(file_path) or os.path.islink(file_path):
-                os.unlink(file_path)
-            elif os.path.isdir(file_path):
-                shutil.rmtree(file_path)
-            elif stat.S_ISFIFO(os.stat(file_path).st_mode):
-                os.unlink(file_path)
+        # The file types come with the directory entries, so no entry needs to be stat'ed
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
 
 
 class SandboxDirectory(Directory):
@@ -60,3 +59,14 @@ class SandboxDirectory(Directory):
         self.checker = Directory(os.path.join(self.directory_root, "checker"))
         self.interactor = Directory(os.path.join(self.directory_root, "interactor"))
         self.manager = Directory(os.path.join(self.directory_root, "manager"))
+
+    def for_worker(self, worker_sandbox_directory: str) -> "SandboxDirectory":
+        """
+        Returns a sandbox rooted at another directory for a parallel worker.
+
+        The compilation directories are shared with this sandbox, so the worker runs the executables compiled here.
+        """
+        sandbox = SandboxDirectory(worker_sandbox_directory)
+        sandbox.solution_compilation = self.solution_compilation
+        sandbox.checker_compilation = self.checker_compilation
+        return sandbox
@@ -76,10 +76,13 @@ class ProblemDirectoryHelper:
 
     sandbox = _problem_path_property("sandbox")
     default_sandbox = _extend_path_property(sandbox, "default")
+    compile_cache = _extend_path_property(sandbox, "compile-cache")
+    parse_cache = _extend_path_property(sandbox, "parse-cache")
 
     logs = _problem_path_property("logs")
     logs_generation = _extend_path_property(logs, "generation")
     logs_invocation = _extend_path_property(logs, "invocation")
+    verdict_cache = _extend_path_property(logs_invocation, ".verdict_cache.json")
 
     # Important files
     problem_yaml = _problem_path_property("problem.yaml")
@@ -93,24 +96,29 @@ class ProblemDirectoryHelper:
     )
 
     def clean_testcases(self, keep_hash=True):
-        testcase_hash_exists = os.path.exists(self.testcases_hashes)
-        if os.path.exists(self.testcases):
-            for filename in os.listdir(self.testcases):
-                file_path = os.path.join(self.testcases, filename)
-                if (
-                    keep_hash
-                    and testcase_hash_exists
-                    and os.path.samefile(file_path, self.testcases_hashes)
-                ):
-                    continue
-                if os.path.isfile(file_path) or os.path.islink(file_path):
-                    os.unlink(file_path)
-                elif os.path.isdir(file_path):
-                    shutil.rmtree(file_path)
+        try:
+            entries = list(os.scandir(self.testcases))
+        except FileNotFoundError:
+            return
+        hash_filename = os.path.basename(self.testcases_hashes)
+        for entry in entries:
+            if keep_hash and entry.name == hash_filename:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+
+    def worker_sandbox(self, worker_id: int) -> str:
+        """Returns the sandbox directory of the given parallel worker."""
+        return os.path.join(self.sandbox, f"worker-{worker_id}")
 
     def clean_logs(self):
-        if os.path.exists(self.logs):
+        """Removes the logs directory. Nothing happens if it does not exist."""
+        try:
             shutil.rmtree(self.logs)
+        except FileNotFoundError:
+            pass
 
     def empty_directory(self, path: str):
         """Empties a directory."""
@@ -123,17 +131,16 @@ class ProblemDirectoryHelper:
                 shutil.rmtree(file_path)
 
     def _is_regular_file(self, path: str):
-        if not os.path.exists(path):
+        try:
+            return stat.S_ISREG(os.stat(path).st_mode)
+        except OSError:
             return False
-        return True
 
     def _is_directory(self, path: str):
-        if not os.path.exists(path):
+        try:
+            return stat.S_ISDIR(os.stat(path).st_mode)
+        except OSError:
             return False
-        st = os.stat(path)
-        if stat.S_ISDIR(st.st_mode):
-            return True
-        return False
 
     def _is_executable(self, path: str):
         if not os.path.exists(path):
@@ -1,5 +1,7 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TextIO
 
+import copy
+import io
 import sys
 
 from abc import ABC, abstractmethod
@@ -37,6 +39,25 @@ class Formatter(ABC):
         self.ANSI_GREY = ""
         self.ANSI_ORANGE = ""
 
+        # None means sys.stdout
+        self.stream: TextIO | None = None
+
+    def captured(self) -> "Formatter":
+        """
+        Returns a copy of this formatter that keeps its output in memory instead,
+        which can be printed later with :meth:`print_captured`.
+        This allows printing from multiple threads without interleaving the output.
+        """
+        formatter = copy.copy(self)
+        formatter.stream = io.StringIO()
+        return formatter
+
+    @abstractmethod
+    def print_captured(self, captured: "Formatter") -> None:
+        """
+        Print the output kept by a formatter returned from :meth:`captured`.
+        """
+
     @abstractmethod
     def print(self, *args, endl=False) -> None:
         """
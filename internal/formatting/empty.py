@@ -8,6 +8,9 @@ class EmptyFormatter(Formatter):
     def print(self, *args, endl=False) -> None:
         pass
 
+    def print_captured(self, captured) -> None:
+        pass
+
     def print_fixed_width(self, *args, width: int, endl=False) -> None:
         pass
 
@@ -1,6 +1,8 @@
+import io
 import os
+import sys
+from typing import TYPE_CHECKING
 
-from internal import commands
 from internal.context import TMTContext
 from internal.outcomes import (
     CompilationOutcome,
@@ -11,6 +13,9 @@ from internal.outcomes import (
 )
 from .base import Formatter
 
+if TYPE_CHECKING:
+    from internal import commands
+
 
 class TerminalFormatter(Formatter):
     """
@@ -35,19 +40,40 @@ class TerminalFormatter(Formatter):
             self.terminal_width = None
         self.cursor = 0
 
+        # On a terminal, every print is flushed to show the progress;
+        # otherwise (for example, in CI logs), flushing only complete lines saves a write for each print
+        self.flush_every_print = self.terminal_width is not None
+
     def advance_cursor(self, num):
         if self.terminal_width is not None:
             self.cursor = (self.cursor + num) % self.terminal_width
 
     def print(self, *args, endl=False):
         # TODO: do we support endline in text?
-        for arg in args:
-            if not isinstance(arg, self.AnsiSequence):
-                self.advance_cursor(len(str(arg)))
+        # Every argument is converted once, and the whole text is written with a single call
+        texts = [str(arg) for arg in args]
+        self.advance_cursor(
+            sum(
+                len(text)
+                for arg, text in zip(args, texts)
+                if not isinstance(arg, self.AnsiSequence)
+            )
+        )
 
         if endl:
             self.cursor = 0
-        print(*args, sep="", flush=True, end=("\n" if endl else ""))
+            texts.append("\n")
+        # Like print(), a stream of None means the current sys.stdout
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write("".join(texts))
+        if endl or self.flush_every_print:
+            stream.flush()
+
+    def print_captured(self, captured):
+        assert isinstance(captured.stream, io.StringIO)
+        print(captured.stream.getvalue(), end="", flush=True, file=self.stream)
+        if isinstance(captured, TerminalFormatter):
+            self.cursor = captured.cursor
 
     def print_fixed_width(self, *args, width, endl=False):
         total_length = 0
@@ -336,12 +362,17 @@ class TerminalFormatter(Formatter):
         # Hash mismatch
         self.println(self.ANSI_RED, "Hash mismatches:", self.ANSI_RESET)
         common_files = official_testcase_hashes.keys() & testcase_hashes.keys()
-        for filename in sorted(common_files):
-            if official_testcase_hashes[filename] != testcase_hashes[filename]:
-                self.println(
-                    tab,
-                    f"{filename}: {official_testcase_hashes[filename]} (found {testcase_hashes[filename]})",
-                )
+        # Usually only a few of the files mismatch, so only those are sorted
+        mismatched_files = [
+            filename
+            for filename in common_files
+            if official_testcase_hashes[filename] != testcase_hashes[filename]
+        ]
+        for filename in sorted(mismatched_files):
+            self.println(
+                tab,
+                f"{filename}: {official_testcase_hashes[filename]} (found {testcase_hashes[filename]})",
+            )
         # Missing files
         missing_files = official_testcase_hashes.keys() - testcase_hashes.keys()
         if len(missing_files) > 0:
@@ -0,0 +1,23 @@
+import hashlib
+import mmap
+import os
+
+# Files smaller than this are read instead; mapping them costs more system calls and page faults than a read
+MMAP_THRESHOLD = 1 << 20
+
+
+def sha256_file(path: str) -> str:
+    """
+    Returns the hex SHA-256 digest of the file content.
+
+    Large files are memory-mapped and hashed in a single update, so they are not copied into memory.
+
+    Args:
+        path: The path to the file.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            return hashlib.sha256(f.read()).hexdigest()
+        with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest()
@@ -222,6 +222,12 @@ class ExecutionOutcome(Enum):
     SKIPPED_SUCCESS = "Execution success (but skipped)"
 
 
+# The outcomes that do not fail a generation step
+EXECUTION_SUCCESS_OUTCOMES = frozenset(
+    {ExecutionOutcome.SUCCESS, ExecutionOutcome.SKIPPED_SUCCESS}
+)
+
+
 @dataclass
 class GenerationResult:
     input_generation: ExecutionOutcome = ExecutionOutcome.UNKNOWN
@@ -234,18 +240,12 @@ class GenerationResult:
     reason: str = ""
 
     def __bool__(self):
-        for outcome in [
-            self.input_generation,
-            self.input_validation,
-            self.output_generation,
-            self.output_validation,
-        ]:
-            if outcome not in [
-                ExecutionOutcome.SUCCESS,
-                ExecutionOutcome.SKIPPED_SUCCESS,
-            ]:
-                return False
-        return True
+        return (
+            self.input_generation in EXECUTION_SUCCESS_OUTCOMES
+            and self.input_validation in EXECUTION_SUCCESS_OUTCOMES
+            and self.output_generation in EXECUTION_SUCCESS_OUTCOMES
+            and self.output_validation in EXECUTION_SUCCESS_OUTCOMES
+        )
 
 
 def eval_outcome_to_run_outcome(eval_res: EvaluationResult) -> ExecutionOutcome:
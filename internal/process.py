@@ -3,9 +3,10 @@ import os
 import select
 import subprocess
 import resource
+import signal
 import traceback
 import platform
-from threading import Timer
+from threading import Thread, Timer
 
 
 class Process(subprocess.Popen):
@@ -22,10 +23,14 @@ class Process(subprocess.Popen):
         stdin_redirect=None,
         stdout_redirect=None,
         stderr_redirect=None,
+        kill_process_group: bool = False,
         **kwargs,
     ):
         """
         Simple but unsafe process sandbox for running programs and tracking time and memory usage.
+
+        If kill_process_group is set, the process is started in its own session, and killing it also kills
+        every descendant (for example, the compilers spawned by make).
         """
 
         self.time_limit_sec: float = time_limit_sec
@@ -49,6 +54,10 @@ class Process(subprocess.Popen):
         self._preexec_fn = kwargs.get("preexec_fn", None)
         kwargs["preexec_fn"] = self.prepare
 
+        self.kill_process_group = kill_process_group
+        if kill_process_group:
+            kwargs["start_new_session"] = True
+
         self.popen_time: float = time.monotonic()
         self.poll_time: float
 
@@ -121,6 +130,15 @@ class Process(subprocess.Popen):
             traceback.print_exc()
             raise e
 
+    def kill(self):
+        if not self.kill_process_group:
+            super().kill()
+            return
+        try:
+            os.killpg(self.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
     def timer_kill(self):
         if self.returncode is None:
             self.timer_triggered = True
@@ -219,29 +237,36 @@ class Process(subprocess.Popen):
         return self.is_cpu_timedout or self.is_wall_clock_timedout
 
 
+def _wait_proc(proc: Process) -> None:
+    try:
+        _, status, rusage = os.wait4(proc.pid, 0)
+    except ChildProcessError:
+        # Already reaped by Process.safe_kill
+        return
+    poll_time = time.monotonic()
+    proc.post_wait(poll_time, status, rusage)
+
+
 def wait_procs(procs: list[Process]) -> None:
     """
     Wait until all processes either terminate or meet their deadlines.
-    This procedures assumes SIGCHILD is blocked before any creation of child processes.
+
+    Every process is reaped by its own PID in a dedicated thread, so that the wall clock time of each process
+    is still accurate, and other threads can wait for their own processes at the same time.
     """
-    # Block SIGCHLD so we can wait for it explicitly
-    pid_to_proc: dict[int, Process] = {p.pid: p for p in procs}
-    remaining_pids: set[int] = set(p.pid for p in procs)
+    waiters = [Thread(target=_wait_proc, args=(proc,)) for proc in procs[1:]]
     try:
-        while remaining_pids:
-            pid = -1
-            while pid == -1:
-                # here calling wait3() should block, so no busy waiting
-                pid, status, rusage = os.wait3(0)
-                poll_time = time.monotonic()
-            assert pid in remaining_pids
-            pid_to_proc[pid].post_wait(poll_time, status, rusage)
-            remaining_pids.remove(pid)
+        for waiter in waiters:
+            waiter.start()
+        if procs:
+            _wait_proc(procs[0])
+        for waiter in waiters:
+            waiter.join()
     finally:
         # Force kill the children to prevent orphans
         # We should never recieve other singals other than SIGINT (and SIGKILL)
-        for pid in remaining_pids:
-            pid_to_proc[pid].safe_kill()
+        for proc in procs:
+            proc.safe_kill()
 
 
 def wait_for_outputs(proc: Process, truncate_length: int = 16384) -> tuple[str, str]:
@@ -259,7 +284,8 @@ def wait_for_outputs(proc: Process, truncate_length: int = 16384) -> tuple[str,
     # because of insufficient buffering (and without allocating too
     # much memory). Unix specific.
 
-    stdout, stderr = b"", b""
+    # Only the first truncate_length bytes are kept; the rest is still read so that the process does not block
+    stdout, stderr = bytearray(), bytearray()
 
     if proc.stdout is not None:
         os.set_blocking(proc.stdout.fileno(), False)
@@ -287,10 +313,9 @@ def wait_for_outputs(proc: Process, truncate_length: int = 16384) -> tuple[str,
                 if len(content) == 0:  # EOF
                     file.close()
                     continue
-                if file is proc.stdout:
-                    stdout += content
-                else:
-                    stderr += content
+                output = stdout if file is proc.stdout else stderr
+                if len(output) < truncate_length:
+                    output += content[: truncate_length - len(output)]
 
         _, status, rusage = os.wait4(proc.pid, 0)
         poll_time = time.monotonic()
@@ -298,6 +323,6 @@ def wait_for_outputs(proc: Process, truncate_length: int = 16384) -> tuple[str,
     finally:
         proc.safe_kill()
     return (
-        stdout[:truncate_length].decode(errors="ignore"),
-        stderr[:truncate_length].decode(errors="ignore"),
+        stdout.decode(errors="ignore"),
+        stderr.decode(errors="ignore"),
     )
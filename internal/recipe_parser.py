@@ -9,7 +9,7 @@ The parsed data includes testsets, subtasks, and validation rules for programmin
 from dataclasses import dataclass
 import copy
 import re
-from typing import List, Set, Optional
+from typing import Iterable, List, Set, Optional
 
 
 @dataclass
@@ -214,10 +214,10 @@ class Testset:
             test.name = test_name
 
     def get_all_test_names(self):
-        return sum(
-            ([tc.name for tc in ts.testcases] for ts in (self.dependency + [self])),
-            start=[],
-        )
+        """
+        Get the test names of the dependencies and then of this testset, in order.
+        """
+        return [tc.name for ts in (*self.dependency, self) for tc in ts.testcases]
 
 
 class Subtask(Testset):
@@ -326,10 +326,15 @@ class RecipeData:
                 for validation in testset.validation:
                     depend.add_validation(validation)
 
+        # The validations of a testset are already deduplicated by add_validation,
+        # so they are copied to its testcases as they are instead of one by one
         for testset in self.testsets.values():
             for test in testset.testcases:
-                for validation in testset.validation:
-                    test.add_validation(validation)
+                if test.validation:
+                    for validation in testset.validation:
+                        test.add_validation(validation)
+                else:
+                    test.validation = list(testset.validation)
 
 
 class ParserContext:
@@ -449,6 +454,21 @@ class CommandHandler:
         if max_args is not None and arg_count > max_args:
             raise ValueError(f"@{parts[0]} requires at most {max_args} argument(s)")
 
+    def parse_validation(self, parts: List[str]) -> Executable:
+        """
+        Parse the validation command of a validation command line.
+
+        Args:
+            parts (List[str]): Command parts including the command name
+
+        Raises:
+            ValueError: If the validation is piped, which is not supported
+        """
+        executable = Executable(" ".join(parts[1:]))
+        if len(executable.commands) != 1:
+            raise ValueError("Validation with pipe is not supported")
+        return executable
+
 
 class TestsetHandler(CommandHandler):
     """Handler for @testset commands."""
@@ -495,8 +515,7 @@ class GlobalValidationHandler(CommandHandler):
         self.validate_args(parts, 1)
 
         self.context.list_expand_constants(parts)
-        command_sequence = " ".join(parts[1:])
-        executable = Executable(command_sequence)
+        executable = self.parse_validation(parts)
         self.context.recipe_data.global_validation.append(executable)
         self.context.current_context = None
         self.context.current_object = None
@@ -551,7 +570,7 @@ class ValidationHandler(CommandHandler):
             )
 
         self.context.list_expand_constants(parts)
-        self.context.current_object.add_validation(Executable(" ".join(parts[1:])))
+        self.context.current_object.add_validation(self.parse_validation(parts))
 
 
 class ConstantHandler(CommandHandler):
@@ -624,13 +643,14 @@ class CommandRegistry:
 
 
 def parse_recipe_data(
-    recipe_lines: List[str], is_outputonly: bool = False
+    recipe_lines: Iterable[str], is_outputonly: bool = False
 ) -> RecipeData:
     """
     Parse recipe and return the structured data.
 
     Args:
-        recipe_lines (list of str): List of lines in a recipe file
+        recipe_lines (iterable of str): Lines of a recipe file, for example the opened file itself.
+            They are consumed lazily, one at a time.
         is_outputonly (bool):
             Whether the recipe is for OutputOnly tasks.
             In this case, the name of each testcase will not contain testset information.
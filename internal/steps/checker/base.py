@@ -1,5 +1,8 @@
+import copy
+import os
 from abc import ABC, abstractmethod
 
+from internal.compilation import get_run_single_command
 from internal.context import CheckerType, TMTContext, SandboxDirectory
 from internal.exceptions import TMTMissingFileError
 from internal.formatting.base import Formatter
@@ -39,6 +42,10 @@ class CheckerStep(ABC):
 
         self.is_generation = is_generation
 
+        # Set by compile when a checker executable is produced
+        self.compiled_checker_path: str | None = None
+        self._checker_exec_command: list[str] | None = None
+
         if context.config.checker is None:
             self.use_default_checker = True
             self.checker_name = "(default)"
@@ -58,6 +65,35 @@ class CheckerStep(ABC):
 
             self.checker_name = context.config.checker.filename
 
+    def with_sandbox(self, sandbox: SandboxDirectory) -> "CheckerStep":
+        """
+        Returns a copy of this step running in another sandbox, for example, of a parallel worker.
+
+        Args:
+            sandbox: The sandbox directory of the copy. The checker must already be compiled.
+        """
+        step = copy.copy(self)
+        step.sandbox = sandbox
+        sandbox.checker.create()
+        return step
+
+    def checker_exec_command(self) -> list[str]:
+        """
+        Returns the command running the compiled checker.
+        It is looked up on the first call and reused for every testcase.
+        """
+        if self._checker_exec_command is None:
+            assert self.compiled_checker_path is not None
+            command = get_run_single_command(
+                context=self.context,
+                directory=os.path.dirname(self.compiled_checker_path),
+                executable_filename_base="checker",
+                executable_stack_size_mib=self.context.config.trusted_step_memory_limit_mib,
+            )
+            assert command is not None
+            self._checker_exec_command = command
+        return self._checker_exec_command
+
     def check_unused_checker(self, formatter: Formatter) -> bool:
         """
         Produce a warning if the checker directory is present but default checker is used indicated by the configuration.
@@ -85,6 +121,7 @@ class CheckerStep(ABC):
     def compile(self) -> CompilationResult:
         """
         Compile the checker.
+        Implementations must reset the run command memoized by :meth:`checker_exec_command`.
         """
         raise NotImplementedError
 
@@ -4,7 +4,6 @@ from pathlib import Path
 import shutil
 import typing
 from internal.compilation.makefile import make_clean, make_compile_target
-from internal.compilation.single import get_run_single_command
 
 from internal.outcomes import (
     EvaluationOutcome,
@@ -37,6 +36,8 @@ class CMSCheckerStep(CheckerStep):
 
     @requires_sandbox
     def compile(self) -> CompilationResult:
+        # The checker may be compiled to another path, so its run command is looked up again
+        self._checker_exec_command = None
         if self.use_default_checker:
             return CompilationResult(CompilationOutcome.SKIPPED)
 
@@ -223,14 +224,7 @@ class CMSCheckerStep(CheckerStep):
                 f.write(result.reason)
 
         else:
-            assert self.compiled_checker_path is not None
-            checker_exec_command = get_run_single_command(
-                context=self.context,
-                directory=os.path.dirname(self.compiled_checker_path),
-                executable_filename_base="checker",
-                executable_stack_size_mib=self.limits.trusted_step_memory_limit_mib,
-            )
-            assert checker_exec_command is not None
+            checker_exec_command = self.checker_exec_command()
 
             # The checker is invoked via
             # checker input_file answer_file output_file > score 2> reason
@@ -6,7 +6,6 @@ from internal.compilation import (
     make_compile_target,
     compile_single,
     make_clean,
-    get_run_single_command,
 )
 from internal.process import Process, wait_procs
 from internal.steps.utils import requires_sandbox
@@ -31,10 +30,11 @@ class ICPCCheckerStep(CheckerStep):
         super().__init__(**kwargs)
 
         self.limits = self.context.config  # shorthand
-        self.compiled_checker_path: str | None = None
 
     @requires_sandbox
     def compile(self) -> CompilationResult:
+        # The checker may be compiled to another path, so its run command is looked up again
+        self._checker_exec_command = None
         workdir = self.sandbox.checker_compilation
         workdir.clean()
 
@@ -94,14 +94,7 @@ class ICPCCheckerStep(CheckerStep):
         feedback_dir = self.sandbox.checker.subdir("feedback_dir")
         feedback_dir.create()
 
-        assert self.compiled_checker_path is not None
-        checker_exec_command = get_run_single_command(
-            context=self.context,
-            directory=os.path.dirname(self.compiled_checker_path),
-            executable_filename_base="checker",
-            executable_stack_size_mib=self.limits.trusted_step_memory_limit_mib,
-        )
-        assert checker_exec_command is not None
+        checker_exec_command = self.checker_exec_command()
         # the output validator is invoked via
         # $ <output_validator_program> input_file answer_file feedback_dir [additional_arguments] < output_file [ > team_input ]
         # we will ignore the [ > team_input ] part, since this only happens for interactive mode.
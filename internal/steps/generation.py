@@ -1,3 +1,4 @@
+import copy
 import os
 import shutil
 import subprocess
@@ -23,6 +24,16 @@ class GenerationStep:
             self.workdir = self.sandbox.generation
             self.workdir.create()
 
+    def with_sandbox(self, sandbox: SandboxDirectory) -> "GenerationStep":
+        """
+        Returns a copy of this step running in another sandbox, for example, of a parallel worker.
+        """
+        step = copy.copy(self)
+        step.sandbox = sandbox
+        step.workdir = sandbox.generation
+        step.workdir.create()
+        return step
+
     @requires_sandbox
     def compile(self) -> CompilationResult:
         comp_result = make_compile_wildcard(
@@ -162,9 +173,7 @@ class GenerationStep:
                 os.path.join(self.context.path.testcases, testcase_input),
             )
             # If testcase output was generated, use this output
-            if os.path.exists(sandbox_testcase_output) and os.path.isfile(
-                sandbox_testcase_output
-            ):
+            if os.path.isfile(sandbox_testcase_output):
                 shutil.move(
                     sandbox_testcase_output,
                     os.path.join(self.context.path.testcases, testcase_output),
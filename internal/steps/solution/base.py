@@ -1,3 +1,4 @@
+import copy
 import os
 import signal
 
@@ -62,6 +63,21 @@ class SolutionStep(ABC):
                 )
         self.grader = context.config.solution.grader_name
 
+    def with_sandbox(self, sandbox: SandboxDirectory) -> "SolutionStep":
+        """
+        Returns a copy of this step running in another sandbox, for example, of a parallel worker.
+
+        The solution must already be compiled, and the sandbox must share the solution compilation directory
+        with the current one (see :meth:`SandboxDirectory.for_worker`).
+
+        Args:
+            sandbox (SandboxDirectory): The sandbox directory of the copy.
+        """
+        step = copy.copy(self)
+        step.sandbox = sandbox
+        sandbox.solution_invocation.create()
+        return step
+
     @abstractmethod
     def compilation_jobs(self) -> Generator[CompilationJob, None, None]:
         """
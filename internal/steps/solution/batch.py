@@ -26,6 +26,8 @@ class BatchSolutionStep(SolutionStep):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.submission_format = [self.context.config.short_name]
+        # Looked up on the first run after compilation, then reused for every testcase
+        self._solution_exec_command: list[str] | None = None
 
     def clean_up(self):
         pass
@@ -51,6 +53,8 @@ class BatchSolutionStep(SolutionStep):
                 standard_error=reason,
             )
 
+        self._solution_exec_command = None
+
         sources = self.submission_files
         for source in map(pathlib.Path, sources):
             if not source.exists() or not source.is_file():
@@ -133,18 +137,19 @@ class BatchSolutionStep(SolutionStep):
         sandbox_output_file = workdir.file(file_out_name)
         sandbox_error_file = workdir.file(file_err_name)
 
-        shutil.copy(testcase_input, sandbox_input_file)
+        shutil.copyfile(testcase_input, sandbox_input_file)
 
         # TODO: noramlly judge should use pipe for I/O, which might make some subtle differences
         # currently, for convenience, it is from file but we should support both modes.
-        solution_exec_command = get_run_single_command(
-            context=self.context,
-            directory=self.sandbox.solution_compilation.subdir("build").path,
-            executable_filename_base=self.executable_name_base,
-            executable_stack_size_mib=self.memory_limit_mib,
-        )
+        if self._solution_exec_command is None:
+            self._solution_exec_command = get_run_single_command(
+                context=self.context,
+                directory=self.sandbox.solution_compilation.subdir("build").path,
+                executable_filename_base=self.executable_name_base,
+                executable_stack_size_mib=self.memory_limit_mib,
+            )
         solution = Process(
-            solution_exec_command,
+            self._solution_exec_command,
             preexec_fn=lambda: os.chdir(workdir.path),
             stdin_redirect=sandbox_input_file,
             stdout_redirect=sandbox_output_file,
@@ -45,6 +45,11 @@ class CommunicationSolutionStep(BatchSolutionStep):
         self.num_procs = self.context.config.solution.num_procs
         self.use_fifo = self.context.config.solution.use_fifo
 
+    def with_sandbox(self, sandbox):
+        step = super().with_sandbox(sandbox)
+        sandbox.manager.create()
+        return step
+
     def clean_up(self):
         super().clean_up()
         make_clean(directory=self.context.path.manager)
@@ -101,7 +106,7 @@ class CommunicationSolutionStep(BatchSolutionStep):
         manager_out_filename = self.sandbox.manager.file(f"{codename}.manager.out")
         manager_err_filename = self.sandbox.manager.file(f"{codename}.manager.err")
 
-        shutil.copy(input_filename, manager_in_filename)
+        shutil.copyfile(input_filename, manager_in_filename)
 
         solution_err_filename = [
             self.sandbox.solution_invocation.file(f"{codename}.sol.{i}.err")
@@ -41,6 +41,12 @@ class ICPCInteractiveSolutionStep(BatchSolutionStep):
 
         self.interactor_name = self.context.config.interactor.filename
 
+    def with_sandbox(self, sandbox):
+        step = super().with_sandbox(sandbox)
+        step.workdir = sandbox.interactor
+        step.workdir.create()
+        return step
+
     def clean_up(self):
         super().clean_up()
         make_clean(directory=self.context.path.interactor)
@@ -102,8 +108,9 @@ class ICPCInteractiveSolutionStep(BatchSolutionStep):
         # Create dummy answer if it doesn't exist
         Path(testcase_answer).touch()
 
-        shutil.copy(testcase_input, sandbox_interactor_input_file)
-        shutil.copy(testcase_answer, sandbox_interactor_answer_file)
+        # Copied rather than hardlinked, so that an interactor writing to them cannot change the testcases
+        shutil.copyfile(testcase_input, sandbox_interactor_input_file)
+        shutil.copyfile(testcase_answer, sandbox_interactor_answer_file)
 
         sandbox_interactor_feedback_dir.create()
 
@@ -31,6 +31,12 @@ class OutputOnlySolutionStep(BatchSolutionStep):
 
         self.supplied_output = False
 
+    def with_sandbox(self, sandbox):
+        if self.supplied_output:
+            # The supplied outputs are only read, so the copy keeps reading them from the current sandbox
+            sandbox.solution_invocation = self.sandbox.solution_invocation
+        return super().with_sandbox(sandbox)
+
     @requires_sandbox
     def compile_solution(self) -> CompilationResult:
         self.sandbox.solution_compilation.clean()
@@ -1,10 +1,15 @@
+import concurrent.futures
 from dataclasses import dataclass
 from enum import Enum
 import functools
-from typing import Callable
+import os
+from typing import TYPE_CHECKING, Callable, Iterable
 
 from internal.outcomes import CompilationResult
 
+if TYPE_CHECKING:
+    from internal.formatting import Formatter
+
 
 def requires_sandbox(func):
     @functools.wraps(func)
@@ -34,3 +39,33 @@ class CompilationJob:
     slot: CompilationSlot
     compile_fn: Callable[[], CompilationResult]
     display_file: str
+
+
+def run_compilation_jobs(
+    jobs: Iterable[CompilationJob],
+    *,
+    formatter: "Formatter",
+    compilation_result: dict[CompilationSlot, CompilationResult],
+) -> bool:
+    """
+    Runs the compilation jobs concurrently, since they are independent of each other and mostly wait for the compilers.
+    At most one job per CPU runs at a time, since compilers are CPU-bound.
+    The results are still printed and recorded into compilation_result in order, up to the first failure.
+
+    Returns:
+        Whether every compilation succeeded.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return True
+    max_workers = min(len(jobs), os.cpu_count() or 1)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(job.compile_fn) for job in jobs]
+        for job, future in zip(jobs, futures):
+            formatter.print(f"{job.slot.value.ljust(10)}  compile ")
+            result = future.result()
+            compilation_result[job.slot] = result
+            formatter.print_compile_result(result, name=job.display_file)
+            if not result:
+                return False
+    return True
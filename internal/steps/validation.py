@@ -1,3 +1,4 @@
+import copy
 import os
 import shutil
 from pathlib import Path
@@ -23,6 +24,16 @@ class ValidationStep:
             self.workdir = self.sandbox.validation
             self.workdir.create()
 
+    def with_sandbox(self, sandbox: SandboxDirectory) -> "ValidationStep":
+        """
+        Returns a copy of this step running in another sandbox, for example, of a parallel worker.
+        """
+        step = copy.copy(self)
+        step.sandbox = sandbox
+        step.workdir = sandbox.validation
+        step.workdir.create()
+        return step
+
     @requires_sandbox
     def compile(self) -> CompilationResult:
         comp_result = make_compile_wildcard(
@@ -74,7 +85,25 @@ class ValidationStep:
                     raise TMTMissingFileError("validator", commands[i][0])
                 commands[i] = validation_command + commands[i][1:]
 
+            # The validators only read the input files, so they are staged once for all validators
+            sandbox_input_file = self.workdir.file(input_filename)
+            sandbox_extra_files = []
             try:
+                shutil.copyfile(
+                    os.path.join(self.context.path.testcases, input_filename),
+                    sandbox_input_file,
+                )
+                for ext in extra_input_exts:
+                    extra_filename = self.context.construct_test_filename(
+                        code_name, ext
+                    )
+                    sandbox_extra_file = self.workdir.file(extra_filename)
+                    shutil.copyfile(
+                        os.path.join(self.context.path.testcases, extra_filename),
+                        sandbox_extra_file,
+                    )
+                    sandbox_extra_files.append(sandbox_extra_file)
+
                 for i, command in enumerate(commands, 1):
                     # Prepare files
                     if len(commands) == 1:
@@ -84,27 +113,9 @@ class ValidationStep:
                         output_filename = f"{code_name}.val.{i}.out"
                         error_filename = f"{code_name}.val.{i}.err"
 
-                    sandbox_input_file = self.workdir.file(input_filename)
                     sandbox_output_file = self.workdir.file(output_filename)
                     sandbox_error_file = self.workdir.file(error_filename)
 
-                    # Copy input and extra inputs
-                    shutil.copy(
-                        os.path.join(self.context.path.testcases, input_filename),
-                        sandbox_input_file,
-                    )
-                    sandbox_extra_files = []
-                    for ext in extra_input_exts:
-                        extra_filename = self.context.construct_test_filename(
-                            code_name, ext
-                        )
-                        sandbox_extra_file = self.workdir.file(extra_filename)
-                        shutil.copy(
-                            os.path.join(self.context.path.testcases, extra_filename),
-                            sandbox_extra_file,
-                        )
-                        sandbox_extra_files.append(sandbox_extra_file)
-
                     # Run validator
                     validator = Process(
                         command,
@@ -118,11 +129,6 @@ class ValidationStep:
 
                     wait_procs([validator])
 
-                    # Clean up input and extra files
-                    for file in [sandbox_input_file] + sandbox_extra_files:
-                        if os.path.exists(file):
-                            os.unlink(file)
-
                     # Touch both output and error, in case they are removed
                     Path(sandbox_output_file).touch()
                     Path(sandbox_error_file).touch()
@@ -180,6 +186,11 @@ class ValidationStep:
             except FileNotFoundError as exception:
                 # We can simply raise, since there will be no processes left
                 raise exception
+            finally:
+                # Clean up input and extra files
+                for file in [sandbox_input_file] + sandbox_extra_files:
+                    if os.path.exists(file):
+                        os.unlink(file)
 
             result.input_validation = ExecutionOutcome.SUCCESS
             return
@@ -0,0 +1,146 @@
+import dataclasses
+import hashlib
+import json
+import os
+from typing import Iterable
+
+from internal import __version__
+from internal.hashing import sha256_file
+from internal.outcomes import EvaluationOutcome, EvaluationResult
+
+
+class VerdictCache:
+    """
+    Persists the evaluation results of invocations, so that an unchanged submission is not run again on unchanged testcases.
+
+    A result is keyed by the digests of every file that may affect it: the problem configs, the submission,
+    the compiled executables (solution, checker, interactor or manager) and the testcase files.
+    The cache file lives in the invocation logs, so it is dropped together with them when the testcases are generated again.
+
+    The digests of the files are also kept, together with the modification time and the size of each file,
+    so that unchanged files are not hashed again on every invocation.
+    Only the most recently used entries are kept, and the digests of files that no longer exist are dropped.
+    """
+
+    MAX_ENTRIES = 10000
+
+    # Failures of the judging process itself are not cached, since they may be fixed without changing any file.
+    # Neither are timeouts, since they may only be caused by the load of the machine.
+    UNCACHED_VERDICTS = frozenset(
+        [
+            EvaluationOutcome.TIMEOUT,
+            EvaluationOutcome.TIMEOUT_WALL,
+            EvaluationOutcome.MANAGER_CRASHED,
+            EvaluationOutcome.MANAGER_FAILED,
+            EvaluationOutcome.MANAGER_TIMEOUT,
+            EvaluationOutcome.CHECKER_CRASHED,
+            EvaluationOutcome.CHECKER_FAILED,
+            EvaluationOutcome.CHECKER_TIMEDOUT,
+            EvaluationOutcome.INTERNAL_ERROR,
+        ]
+    )
+
+    def __init__(self, cache_file: str, invocation_files: list[str]):
+        """
+        Args:
+            cache_file: The path to the cache file. It is fine if it does not exist yet.
+            invocation_files: The files that affect every result of this invocation.
+        """
+        self.cache_file = cache_file
+        self.entries: dict[str, dict] = {}
+        # Maps each file to [modification time in ns, size, digest]
+        self.file_digests: dict[str, list] = {}
+        try:
+            with open(cache_file, "r") as f:
+                content = json.load(f)
+            if isinstance(content.get("entries"), dict):
+                self.entries = content["entries"]
+            if isinstance(content.get("file_digests"), dict):
+                self.file_digests = content["file_digests"]
+        except (OSError, ValueError, AttributeError):
+            pass
+
+        # The results may be derived differently by another version of tmt
+        digest = hashlib.sha256(__version__.encode())
+        for file in invocation_files:
+            digest.update(self._file_digest(file).encode())
+        self.invocation_digest = digest.hexdigest()
+
+    def _file_digest(self, file: str) -> str:
+        """
+        Returns the digest of the file, hashing it only if it changed since it was last hashed.
+        """
+        stat = os.stat(file)
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        known = self.file_digests.get(file)
+        if known is not None and known[:2] == stamp:
+            return known[2]
+        digest = sha256_file(file)
+        self.file_digests[file] = stamp + [digest]
+        return digest
+
+    def key(self, testcase_files: list[str]) -> str:
+        """
+        Returns the cache key of running this invocation on the testcase consisting of the given files.
+        """
+        digest = hashlib.sha256(self.invocation_digest.encode())
+        for file in testcase_files:
+            try:
+                file_digest = self._file_digest(file)
+            except OSError:
+                file_digest = "(missing)"
+            digest.update(file_digest.encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> EvaluationResult | None:
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            return None
+        # Reinserted to mark it as the most recently used; the entries are kept in the order of use
+        self.entries[key] = entry
+        fields = {name: value for name, value in entry.items() if name != "log_files"}
+        try:
+            return EvaluationResult(
+                **(fields | {"verdict": EvaluationOutcome[entry["verdict"]]})
+            )
+        except (KeyError, TypeError):
+            return None
+
+    def log_files(self, key: str) -> list[str]:
+        """
+        Returns the names of the logs written by the run whose result is cached under key.
+        """
+        entry = self.entries.get(key)
+        return entry.get("log_files", []) if entry is not None else []
+
+    def put(
+        self, key: str, result: EvaluationResult, *, log_files: Iterable[str] = ()
+    ) -> None:
+        """
+        Args:
+            log_files: The names of the logs written by the run, which no longer describe the result when it is taken from the cache.
+        """
+        if result.verdict in self.UNCACHED_VERDICTS:
+            return
+        entry = dataclasses.asdict(result)
+        entry["verdict"] = result.verdict.name
+        entry["output_file"] = None
+        entry["log_files"] = sorted(log_files)
+        self.entries.pop(key, None)
+        self.entries[key] = entry
+
+    def save(self) -> None:
+        """
+        Writes the cache file atomically, dropping the least recently used entries and the digests of files that no longer exist.
+        """
+        for key in list(self.entries)[: -self.MAX_ENTRIES]:
+            del self.entries[key]
+        self.file_digests = {
+            file: known
+            for file, known in self.file_digests.items()
+            if os.path.exists(file)
+        }
+        temp_file = self.cache_file + ".tmp"
+        with open(temp_file, "w") as f:
+            json.dump({"entries": self.entries, "file_digests": self.file_digests}, f)
+        os.replace(temp_file, self.cache_file)
@@ -372,10 +372,7 @@ class VerdictsVerifier(Verifier):
             return
 
         # Check testcase generated
-        if not (
-            os.path.exists(context.path.testcase_summary)
-            and os.path.isfile(context.path.testcase_summary)
-        ):
+        if not os.path.isfile(context.path.testcase_summary):
             self.add_issue(
                 "testcases_not_generated",
                 context.path.testcase_summary,
@@ -3,11 +3,17 @@ import enum
 import os
 import yaml
 
+from internal.cache import load_or_compute
 from internal.context import TMTContext
 from internal.exceptions import TMTMissingFileError, TMTInvalidConfigError
 from internal.outcomes import EvaluationOutcome, EvaluationOutcomeGroup
 from internal.context.paths import ProblemDirectoryHelper
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 class ExpectedVerdict(enum.Enum):
     ACCEPTED = (
@@ -352,12 +358,19 @@ class SolutionVerdict:
         return solution
 
 
+def _load_yaml(path: str):
+    with open(path, "r") as file:
+        return yaml.load(file, Loader=SafeLoader)
+
+
 def parse_verdicts(context: TMTContext):
     helper = context.path
     yaml_path = helper.verdicts_yaml
     try:
-        with open(yaml_path, "r") as file:
-            verdicts_yaml = yaml.safe_load(file)
+        # Memoized on disk like the other problem files, see TMTContext
+        verdicts_yaml = load_or_compute(
+            yaml_path, _load_yaml, cache_directory=helper.parse_cache
+        )
     except (FileNotFoundError, IsADirectoryError, PermissionError) as e:
         raise TMTMissingFileError("config", yaml_path) from e
     except yaml.YAMLError as e:
@@ -0,0 +1,86 @@
+import os
+import pathlib
+
+import pytest
+
+import internal.verdict_cache
+from internal.cache import load_or_compute
+from internal.outcomes import EvaluationOutcome, EvaluationResult
+from internal.verdict_cache import VerdictCache
+
+
+def test_load_or_compute(tmp_path: pathlib.Path):
+    cache_directory = str(tmp_path / "cache")
+    source = tmp_path / "source.txt"
+    source.write_text("first")
+
+    loads: list[str] = []
+
+    def loader(path: str) -> str:
+        loads.append(path)
+        with open(path) as f:
+            return f.read()
+
+    def load(**kwargs) -> str:
+        return load_or_compute(
+            str(source), loader, cache_directory=cache_directory, **kwargs
+        )
+
+    assert load() == "first"
+    assert load() == "first"
+    assert len(loads) == 1
+
+    # Any change of the file invalidates the memoized result, which is then replaced
+    source.write_text("second!")
+    assert load() == "second!"
+    assert len(loads) == 2
+    assert len(os.listdir(cache_directory)) == 1
+
+    # Different variants are memoized separately
+    assert load(variant=(True,)) == "second!"
+    assert len(loads) == 3
+
+
+def test_verdict_cache(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    cache_file = str(tmp_path / "verdicts.json")
+    submission = tmp_path / "submission.cpp"
+    submission.write_text("int main() {}")
+    testcase = tmp_path / "1.in"
+    testcase.write_text("1")
+
+    cache = VerdictCache(cache_file, [str(submission)])
+    key = cache.key([str(testcase)])
+    cache.put(key, EvaluationResult(codename="1", verdict=EvaluationOutcome.ACCEPTED))
+    cache.save()
+
+    cache = VerdictCache(cache_file, [str(submission)])
+    result = cache.get(cache.key([str(testcase)]))
+    assert result is not None and result.verdict is EvaluationOutcome.ACCEPTED
+
+    # Timeouts may be caused by the load of the machine, so they are measured again
+    timeout_key = cache.key([str(submission)])
+    cache.put(
+        timeout_key, EvaluationResult(codename="1", verdict=EvaluationOutcome.TIMEOUT)
+    )
+    assert cache.get(timeout_key) is None
+
+    # Another version of tmt may derive the results differently
+    monkeypatch.setattr(internal.verdict_cache, "__version__", "0.0.0-other")
+    assert VerdictCache(cache_file, [str(submission)]).key([str(testcase)]) != key
+    monkeypatch.undo()
+
+    # Only the most recently used entries are kept, and the digests of removed files are dropped
+    monkeypatch.setattr(VerdictCache, "MAX_ENTRIES", 2)
+    for codename in ["2", "3"]:
+        other = tmp_path / f"{codename}.in"
+        other.write_text(codename)
+        cache.put(cache.key([str(other)]), EvaluationResult(codename=codename))
+    assert cache.get(key) is not None
+    (tmp_path / "2.in").unlink()
+    cache.save()
+
+    cache = VerdictCache(cache_file, [str(submission)])
+    assert len(cache.entries) == 2
+    assert cache.get(key) is not None
+    assert str(tmp_path / "2.in") not in cache.file_digests
+    assert str(tmp_path / "3.in") in cache.file_digests
@@ -1,7 +1,12 @@
 # Test for compilation error reporting:
 # This test uses LanguageDummy to force generate a compilation error,
 # thus, we can check if the step actually fails and collects the compilation error string.
+import os
 import pathlib
+import platform
+import shutil
+import subprocess
+import sys
 import pytest
 
 from internal.context import TMTContext
@@ -13,6 +18,14 @@ from internal.outcomes import (
 )
 from internal.commands import command_clean
 from internal.commands.gen import command_gen
+from internal.compilation import compile_single
+from internal.compilation.cache import CompileCache
+from internal.compilation.languages.cpp import LanguageCpp
+from internal.compilation.makefile import (
+    _get_make,
+    _get_make_parallel_flags,
+    make_compile_target,
+)
 
 from internal.steps.utils import CompilationSlot
 from tests.languages.dummy import LanguageDummy
@@ -97,3 +110,215 @@ def test_compilation(
     check_compilation(
         expected_results.interact, cresult.get(CompilationSlot.INTERACTOR)
     )
+
+
+def test_compile_cache(tmp_path: pathlib.Path):
+    script_dir = pathlib.Path(__file__).parent.parent.resolve()
+    problem_dir = pathlib.Path(__file__).parent.resolve() / "problems/batch/cms-checker"
+    context = TMTContext(str(problem_dir), str(script_dir))
+    shutil.rmtree(context.path.compile_cache, ignore_errors=True)
+
+    def compile_solution(directory: pathlib.Path):
+        directory.mkdir()
+        return compile_single(
+            context=context,
+            directory=str(directory),
+            sources=[str(problem_dir / "solutions" / "model-solution.cpp")],
+            executable_filename_base="solution",
+            executable_stack_size_mib=256,
+        )
+
+    first = compile_solution(tmp_path / "first")
+    assert first.verdict == OK
+    assert len(os.listdir(context.path.compile_cache)) == 2
+
+    # A cache hit only restores the executable, without running make
+    second = compile_solution(tmp_path / "second")
+    assert second.verdict == OK
+    assert second.produced_file == str(tmp_path / "second" / "build" / "solution")
+    assert os.listdir(tmp_path / "second" / "build") == ["solution"]
+    assert second.standard_error == first.standard_error
+
+
+def test_compile_cache_source_order(tmp_path: pathlib.Path):
+    script_dir = pathlib.Path(__file__).parent.parent.resolve()
+    problem_dir = pathlib.Path(__file__).parent.resolve() / "problems/batch/cms-checker"
+    context = TMTContext(str(problem_dir), str(script_dir))
+    cache = CompileCache(str(tmp_path / "cache"))
+
+    # The first Python source becomes the entry point, so reordering the same sources must not hit the cache
+    def compile_and_run(name: str, sources: list[str]) -> str:
+        directory = tmp_path / name
+        directory.mkdir()
+        (directory / "a.py").write_text('print("a")\n')
+        (directory / "b.py").write_text('print("b")\n')
+        result = make_compile_target(
+            context=context,
+            directory=str(directory),
+            sources=sources,
+            target="solution",
+            executable_stack_size_mib=256,
+            cache=cache,
+        )
+        assert result.verdict == OK
+        assert result.produced_file is not None
+        return subprocess.run(
+            [sys.executable, result.produced_file], capture_output=True, text=True
+        ).stdout
+
+    assert compile_and_run("first", ["a.py", "b.py"]) == "a\n"
+    assert compile_and_run("second", ["b.py", "a.py"]) == "b\n"
+
+
+def test_make_jobs(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("MAKE", "make")
+    monkeypatch.delenv("MAKEFLAGS", raising=False)
+    monkeypatch.setenv("TMT_MAX_MAKE_JOBS", "3")
+    assert _get_make() == ["make"]
+    assert _get_make_parallel_flags() == ["-j3", "-l3"]
+
+    # The choices of the user are kept
+    monkeypatch.setenv("MAKEFLAGS", "-j8 --load-average=6")
+    assert _get_make() == ["make", "-j8", "--load-average=6"]
+    assert _get_make_parallel_flags() == []
+    monkeypatch.setenv("MAKEFLAGS", "-j8")
+    assert _get_make_parallel_flags() == ["-l3"]
+
+
+# RLIMIT_AS is not enforced on macOS
+@pytest.mark.skipif(platform.system() == "Darwin", reason="RLIMIT_AS is not enforced")
+def test_compile_memory_limit(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    script_dir = pathlib.Path(__file__).parent.parent.resolve()
+    problem_dir = pathlib.Path(__file__).parent.resolve() / "problems/batch/cms-checker"
+    context = TMTContext(str(problem_dir), str(script_dir))
+    context.config.compile_memory_limit_mib = 128
+
+    # The fake compiler allocates the given amount of memory, then creates its output files
+    compiler = tmp_path / "compiler.py"
+    compiler.write_text(
+        "import sys\n"
+        "allocated = bytearray(int(sys.argv[1]) << 20)\n"
+        "arguments = sys.argv[2:]\n"
+        'for flag in ("-MF", "-o"):\n'
+        "    if flag in arguments:\n"
+        '        open(arguments[arguments.index(flag) + 1], "w").close()\n'
+    )
+
+    def compile_source(name: str, allocated_mib: int):
+        monkeypatch.setenv("CXX", f"{sys.executable} {compiler} {allocated_mib}")
+        directory = tmp_path / name
+        directory.mkdir()
+        (directory / "main.cpp").write_text("int main() {}\n")
+        return make_compile_target(
+            context=context,
+            directory=str(directory),
+            sources=["main.cpp"],
+            target="main",
+            executable_stack_size_mib=256,
+        )
+
+    normal = compile_source("normal", 16)
+    assert normal.verdict == OK
+    assert normal.produced_file is not None
+
+    hog = compile_source("hog", 256)
+    assert hog.verdict == CompilationOutcome.FAILED
+    assert hog.produced_file is None
+
+
+@pytest.mark.parametrize(
+    "installed, distcc_hosts, expected",
+    [
+        ([], "host", {}),
+        (["ccache"], "", {"CXX": "/bin/ccache g++", "CCACHE_BASEDIR": "(problem)"}),
+        (
+            ["ccache", "distcc"],
+            "",
+            {"CXX": "/bin/ccache g++", "CCACHE_BASEDIR": "(problem)"},
+        ),
+        (
+            ["ccache", "sccache", "distcc"],
+            "host",
+            {
+                "CXX": "/bin/ccache g++",
+                "CCACHE_BASEDIR": "(problem)",
+                "CCACHE_PREFIX": "/bin/distcc",
+            },
+        ),
+        (["sccache", "distcc"], "host", {"CXX": "/bin/distcc g++"}),
+        (["sccache", "distcc"], "", {"CXX": "/bin/sccache g++"}),
+        (["distcc"], "", {}),
+    ],
+)
+def test_compiler_launcher_env(
+    installed: list[str],
+    distcc_hosts: str,
+    expected: dict[str, str],
+    monkeypatch: pytest.MonkeyPatch,
+):
+    script_dir = pathlib.Path(__file__).parent.parent.resolve()
+    problem_dir = pathlib.Path(__file__).parent.resolve() / "problems/batch/cms-checker"
+    context = TMTContext(str(problem_dir), str(script_dir))
+
+    monkeypatch.setattr(
+        shutil, "which", lambda name: f"/bin/{name}" if name in installed else None
+    )
+    monkeypatch.setenv("DISTCC_HOSTS", distcc_hosts)
+
+    extra_env = LanguageCpp(context).get_make_target_command(256).extra_env
+    launcher_env = {
+        name: value
+        for name, value in extra_env.items()
+        if name == "CXX" or name.startswith("CCACHE_")
+    }
+    expected = {
+        name: context.path.problem_dir if value == "(problem)" else value
+        for name, value in expected.items()
+    }
+    assert launcher_env == expected
+
+
+def test_compiler_launcher_overridden_by_cxx(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+):
+    script_dir = pathlib.Path(__file__).parent.parent.resolve()
+    problem_dir = pathlib.Path(__file__).parent.resolve() / "problems/batch/cms-checker"
+    context = TMTContext(str(problem_dir), str(script_dir))
+
+    # Both wrappers record their use and run the real compiler
+    log = tmp_path / "log"
+
+    def wrapper(name: str) -> str:
+        path = tmp_path / name
+        path.write_text(f'#!/bin/sh\necho {name} >> {log}\nexec "$@"\n')
+        path.chmod(0o755)
+        return str(path)
+
+    ccache = wrapper("ccache")
+    cxx = wrapper("cxx")
+    which = shutil.which
+    monkeypatch.setattr(
+        shutil, "which", lambda name: ccache if name == "ccache" else which(name)
+    )
+
+    def compile_source(name: str):
+        directory = tmp_path / name
+        directory.mkdir()
+        (directory / "main.cpp").write_text("int main() {}\n")
+        result = make_compile_target(
+            context=context,
+            directory=str(directory),
+            sources=["main.cpp"],
+            target="main",
+            executable_stack_size_mib=256,
+        )
+        assert result.verdict == OK
+
+    monkeypatch.delenv("CXX", raising=False)
+    compile_source("launcher")
+    assert set(log.read_text().split()) == {"ccache"}
+
+    log.unlink()
+    monkeypatch.setenv("CXX", f"{cxx} g++")
+    compile_source("overridden")
+    assert set(log.read_text().split()) == {"cxx"}
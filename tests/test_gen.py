@@ -159,9 +159,11 @@ expected_results_outputonly_basic = (
     ],
 )
 # fmt: on
+@pytest.mark.parametrize("jobs", [1, 4])
 def test_gen(
     problem_path: str,
     expected_results: tuple[ExpectedCompilation, dict[str, GenerationResult]],
+    jobs: int,
 ):
     script_dir = pathlib.Path(__file__).parent.parent.resolve()
     problem_dir = pathlib.Path(__file__).parent.resolve() / problem_path
@@ -174,8 +176,14 @@ def test_gen(
 
     command_clean(formatter=formatter, context=context, skip_confirm=True)
     command_result = command_gen(
-        formatter=formatter, context=context, verify_hash=False, show_reason=False
+        formatter=formatter,
+        context=context,
+        verify_hash=False,
+        show_reason=False,
+        jobs=jobs,
     )
+    # The sandboxes of the parallel workers are removed once they finish
+    assert not os.path.exists(context.path.worker_sandbox(0))
 
     expected_compilation, expected_generation = expected_results
 
@@ -1,5 +1,7 @@
 import operator
+import os
 import pathlib
+import shutil
 from typing import Callable
 import pytest
 
@@ -13,6 +15,7 @@ from internal.outcomes import (
 )
 from internal.commands import command_clean
 from internal.commands.gen import command_gen
+from internal.verdict_cache import VerdictCache
 
 # fmt: off
 
@@ -246,3 +249,78 @@ def test_invoke(
             assert invoke_result is not None
             for pred in predicates:
                 pred(submission, invoke_result)
+
+
+@pytest.mark.parametrize("problem, submission", [
+    ("batch/cms-checker", "model-solution.cpp"),
+    ("batch/cms-checker", "partial.cpp"),
+    ("batch/cms-checker", "checker-fail.cpp"),
+    ("batch/cms-verdict", "model-solution.py"),
+])
+def test_invoke_cache(problem: str, submission: str, tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    script_dir = pathlib.Path(__file__).parent.parent.resolve()
+    problem_dir = pathlib.Path(__file__).parent.resolve() / "problems" / problem
+    formatter = TerminalFormatter()
+    context = TMTContext(str(problem_dir), str(script_dir))
+    context.config.trusted_step_time_limit_sec = 1.0
+
+    command_clean(formatter=formatter, context=context, skip_confirm=True)
+    command_gen(formatter=formatter, context=context, verify_hash=False, show_reason=False)
+
+    # Records whether each lookup of the cache hit
+    lookups: list[bool] = []
+    original_get = VerdictCache.get
+
+    def spied_get(self, key):
+        result = original_get(self, key)
+        lookups.append(result is not None)
+        return result
+
+    monkeypatch.setattr(VerdictCache, "get", spied_get)
+
+    # A copy of the submission, so that it can be changed below
+    submission_file = tmp_path / submission
+    shutil.copyfile(problem_dir / "solutions" / submission, submission_file)
+
+    def invoke():
+        lookups.clear()
+        return command_invoke(formatter=formatter,
+                              context=context,
+                              show_reason=False,
+                              submission_files=[str(submission_file)],
+                              use_cache=True)
+
+    first = invoke()
+    assert lookups and not any(lookups)
+
+    # Every result is taken from the cache, except for the failures of the judging process
+    second = invoke()
+    assert first.testcase_results.keys() == second.testcase_results.keys()
+    expected_hits = [result.verdict not in VerdictCache.UNCACHED_VERDICTS
+                     for result in first.testcase_results.values()]
+    assert lookups == expected_hits
+    for codename, result in first.testcase_results.items():
+        cached = second.testcase_results[codename]
+        assert (cached.verdict, cached.score) == (result.verdict, result.score)
+
+    # The logs of the cached runs are removed, except for the solution log written from the result
+    def testcase_logs(codename: str) -> set[str]:
+        return {name for name in os.listdir(context.path.logs_invocation) if name.startswith(codename + ".")}
+    for codename, hit in zip(first.testcase_results.keys(), expected_hits):
+        if hit:
+            assert testcase_logs(codename) == {codename + ".sol.log"}
+        else:
+            assert len(testcase_logs(codename)) > 1
+
+    # Changing a testcase misses only that testcase
+    codenames = list(first.testcase_results.keys())
+    changed_codename = codenames[0]
+    answer_file = pathlib.Path(context.path.testcases) / context.construct_output_filename(changed_codename)
+    answer_file.write_bytes(answer_file.read_bytes() + b"\n")
+    invoke()
+    assert lookups == [hit and codename != changed_codename for hit, codename in zip(expected_hits, codenames)]
+
+    # Changing the submission misses every testcase
+    submission_file.write_bytes(submission_file.read_bytes() + b"\n")
+    invoke()
+    assert lookups and not any(lookups)
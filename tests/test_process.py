@@ -0,0 +1,39 @@
+import subprocess
+import time
+
+from internal.process import Process, wait_for_outputs
+
+
+def test_timeout_kills_process_group():
+    # The grandchild keeps the pipes open; without killing the whole process group,
+    # wait_for_outputs would block until the grandchild exits by itself.
+    start = time.monotonic()
+    process = Process(
+        ["sh", "-c", "sleep 30 & wait"],
+        time_limit_sec=0.5,
+        memory_limit_mib=256,
+        kill_process_group=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    wait_for_outputs(process)
+
+    assert process.timer_triggered
+    assert process.is_timedout
+    assert time.monotonic() - start < 10
+
+
+def test_outputs_are_truncated():
+    # The output beyond the limit must still be drained, otherwise the process blocks on a full pipe
+    process = Process(
+        ["sh", "-c", "head -c 1000000 /dev/zero; head -c 100 /dev/zero >&2"],
+        time_limit_sec=10,
+        memory_limit_mib=256,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    stdout, stderr = wait_for_outputs(process, truncate_length=1000)
+
+    assert process.status == 0
+    assert stdout == "\0" * 1000
+    assert stderr == "\0" * 100
@@ -1,20 +1,8 @@
 import argparse
-import pathlib
-
-from internal.commands.verify import command_verify_config, command_verify_verdicts
-from internal.context import TMTContext, find_problem_dir
-from internal.commands import (
-    command_gen,
-    command_invoke,
-    command_clean,
-    command_export,
-    command_make_public,
-    command_verify,
-)
+import os
+
 from internal.exceptions import TMTMissingFileError, TMTInvalidConfigError
 from internal import __version__
-from internal.formatting import TerminalFormatter
-from internal.verify.verifier import TMTVerifyIssueType
 
 
 def main():
@@ -41,10 +29,31 @@ def main():
         action="store_true",
         help="Check if the hash digest of the testcases matches.",
     )
+    parser_gen.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        nargs="?",
+        default=1,
+        const=os.cpu_count() or 1,
+        help="The number of testcases to generate in parallel. Without a number, one for each CPU.",
+    )
 
     parser_invoke = subparsers.add_parser("invoke", help="Invoke a solution.")
-    parser_invoke.add_argument("-r", "--show-reason", action="store_true")
-    parser_invoke.add_argument("submission_files", nargs="*")
+    parser_invoke.add_argument(
+        "-r",
+        "--show-reason",
+        action="store_true",
+        help="Show the failed reason and checker's output of each testcase.",
+    )
+    parser_invoke.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Run the submission on every testcase even if the result is cached.",
+    )
+    parser_invoke.add_argument(
+        "submission_files", nargs="+", help="The files of the submission."
+    )
 
     parser_clean = subparsers.add_parser(
         "clean", help="Clean-up a TMT problem directory."
@@ -77,10 +86,13 @@ def main():
         print("Directory initialization is not implemented yet.")
         return
 
+    # Imported only after the arguments are parsed, so that --help and --version do not have to load every command
+    from internal.context import TMTContext, find_problem_dir
+    from internal.formatting import TerminalFormatter
+
     formatter = TerminalFormatter()
-    cwd = pathlib.Path.cwd()
-    problem_dir = find_problem_dir(cwd)  # TODO specify it in args
-    script_dir = str(pathlib.Path(__file__).parent.resolve())
+    problem_dir = find_problem_dir(os.getcwd())  # TODO specify it in args
+    script_dir = os.path.dirname(os.path.realpath(__file__))
     context = TMTContext(problem_dir, script_dir)
 
     # This check could be placed inside __init__ of TMTContext and check for certain environments,
@@ -94,36 +106,55 @@ def main():
         )
 
     if args.command == "gen":
+        from internal.commands import command_gen
+
         cmd_ret = command_gen(
             formatter=formatter,
             context=context,
             verify_hash=args.verify_hash,
             show_reason=args.show_reason,
+            jobs=args.jobs,
         )
         return bool(cmd_ret)
 
     if args.command == "invoke":
+        from internal.commands import command_invoke
+
         cmd_ret = command_invoke(
             formatter=formatter,
             context=context,
             show_reason=args.show_reason,
             submission_files=args.submission_files,
+            use_cache=not args.no_cache,
         )
         return bool(cmd_ret)
 
     if args.command == "clean":
+        from internal.commands import command_clean
+
         command_clean(formatter=formatter, context=context, skip_confirm=args.yes)
         return True  # Does not fail without exception
 
     if args.command == "export":
+        from internal.commands import command_export
+
         command_export(formatter=formatter, context=context, output_path=args.output)
         return True  # Does not fail without exception
 
     if args.command == "make-public":
+        from internal.commands import command_make_public
+
         ret = command_make_public(formatter=formatter, context=context)
         return ret
 
     if args.command == "verify":
+        from internal.commands.verify import (
+            command_verify,
+            command_verify_config,
+            command_verify_verdicts,
+        )
+        from internal.verify.verifier import TMTVerifyIssueType
+
         if args.issue_class == "all" or args.issue_class is None:
             ret = command_verify(
                 print_issues=True, formatter=formatter, context=context